@@ -258,6 +258,14 @@ MLFLOW_SQLALCHEMYSTORE_POOLCLASS = _EnvironmentVariable(
     "MLFLOW_SQLALCHEMYSTORE_POOLCLASS", str, None
 )
 
+#: Specifies the ``query_cache_size`` parameter to use for ``sqlalchemy.create_engine`` in the
+#: SQLAlchemy tracking store. See https://docs.sqlalchemy.org/en/14/core/engines.html#sqlalchemy.create_engine.params.query_cache_size
+#: for more information.
+#: (default: ``None``)
+MLFLOW_SQLALCHEMYSTORE_QUERY_CACHE_SIZE = _EnvironmentVariable(
+    "MLFLOW_SQLALCHEMYSTORE_QUERY_CACHE_SIZE", int, None
+)
+
 #: Specifies the ``timeout_seconds`` for MLflow Model dependency inference operations.
 #: (default: ``120``)
 MLFLOW_REQUIREMENTS_INFERENCE_TIMEOUT = _EnvironmentVariable(
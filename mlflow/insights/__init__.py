@@ -0,0 +1,41 @@
+"""MLflow Insights: structured analyses, hypotheses, and issues for trace data."""
+
+from mlflow.insights.models import (
+    Analysis,
+    AnalysisStatus,
+    AnalysisSummary,
+    BaselineCensus,
+    BaselineCensusMetadata,
+    BaselineCensusOperationalMetrics,
+    BaselineCensusQualityMetrics,
+    EvidenceEntry,
+    Hypothesis,
+    HypothesisStatus,
+    HypothesisSummary,
+    Issue,
+    IssueEvidenceEntry,
+    IssueSeverity,
+    IssueStatus,
+    IssueSummary,
+    SqlQueryEntry,
+)
+
+__all__ = [
+    "Analysis",
+    "AnalysisStatus",
+    "AnalysisSummary",
+    "BaselineCensus",
+    "BaselineCensusMetadata",
+    "BaselineCensusOperationalMetrics",
+    "BaselineCensusQualityMetrics",
+    "EvidenceEntry",
+    "Hypothesis",
+    "HypothesisStatus",
+    "HypothesisSummary",
+    "Issue",
+    "IssueEvidenceEntry",
+    "IssueSeverity",
+    "IssueStatus",
+    "IssueSummary",
+    "SqlQueryEntry",
+]
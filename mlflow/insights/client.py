@@ -0,0 +1,304 @@
+"""Client SDK for MLflow Insights.
+
+``InsightsClient`` manages analyses, hypotheses, and issues stored as YAML artifacts
+on nested MLflow runs (see :py:mod:`mlflow.insights.utils` for the storage layout).
+"""
+
+from typing import Any
+
+from mlflow.entities import Trace
+from mlflow.exceptions import MlflowException
+from mlflow.insights.models import (
+    Analysis,
+    AnalysisStatus,
+    AnalysisSummary,
+    Hypothesis,
+    HypothesisStatus,
+    Issue,
+    IssueSeverity,
+    IssueStatus,
+    SqlQueryEntry,
+)
+from mlflow.insights.utils import (
+    ANALYSIS_FILENAME,
+    create_nested_analysis_run,
+    delete_yaml_file,
+    list_analysis_runs,
+    list_yaml_files,
+    load_from_yaml,
+    save_to_yaml,
+    validate_run_has_analysis,
+)
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE, RESOURCE_DOES_NOT_EXIST
+from mlflow.store.entities.paged_list import PagedList
+from mlflow.tracking import MlflowClient
+
+_HYPOTHESIS_PREFIX = "hypothesis_"
+_ISSUE_PREFIX = "issue_"
+
+
+def _paginate(items: list[Any], page_size: int | None, page_token: str | None) -> PagedList[Any]:
+    """Slice ``items`` into a PagedList using an integer-offset token.
+
+    With ``page_size=None`` the full list is returned with no continuation token,
+    preserving the unpaged behavior for existing callers.
+    """
+    if page_size is None and page_token is None:
+        return PagedList(items, None)
+    try:
+        offset = int(page_token) if page_token else 0
+    except ValueError:
+        raise MlflowException(
+            f"Invalid page token: '{page_token}'", error_code=INVALID_PARAMETER_VALUE
+        )
+    page_size = page_size or 100
+    page = items[offset : offset + page_size]
+    next_token = str(offset + page_size) if offset + page_size < len(items) else None
+    return PagedList(page, next_token)
+
+
+class InsightsClient:
+    """Client for creating and querying insights analyses, hypotheses, and issues."""
+
+    def __init__(self, tracking_client: MlflowClient | None = None):
+        self._client = tracking_client or MlflowClient()
+
+    # ------------------------------------------------------------------ analyses
+
+    def create_analysis(self, experiment_id: str, name: str, description: str = "") -> str:
+        """Create a new analysis run and return its run ID."""
+        run_id = create_nested_analysis_run(self._client, experiment_id, name)
+        analysis = Analysis(name=name, description=description)
+        save_to_yaml(self._client, run_id, ANALYSIS_FILENAME, analysis)
+        return run_id
+
+    def get_analysis(self, insights_run_id: str) -> Analysis:
+        """Load the analysis stored on the given run."""
+        self._validate_analysis_run(insights_run_id)
+        return load_from_yaml(self._client, insights_run_id, ANALYSIS_FILENAME, Analysis)
+
+    def list_analyses(
+        self,
+        experiment_id: str,
+        page_size: int | None = None,
+        page_token: str | None = None,
+    ) -> PagedList[AnalysisSummary]:
+        """List summaries of all analyses in the experiment, newest first."""
+        summaries = []
+        for run in list_analysis_runs(self._client, experiment_id):
+            try:
+                analysis = load_from_yaml(
+                    self._client, run.info.run_id, ANALYSIS_FILENAME, Analysis
+                )
+            except Exception:
+                continue
+            summaries.append(AnalysisSummary.from_analysis(analysis, run.info.run_id))
+        return _paginate(summaries, page_size, page_token)
+
+    def update_analysis(
+        self,
+        insights_run_id: str,
+        description: str | None = None,
+        status: AnalysisStatus | None = None,
+    ) -> Analysis:
+        """Update the analysis stored on the given run."""
+        analysis = self.get_analysis(insights_run_id)
+        if description is not None:
+            analysis.description = description
+        if status is not None:
+            analysis.status = status
+        analysis.update_timestamp()
+        save_to_yaml(self._client, insights_run_id, ANALYSIS_FILENAME, analysis)
+        return analysis
+
+    # ---------------------------------------------------------------- hypotheses
+
+    def create_hypothesis(
+        self, insights_run_id: str, statement: str, testing_plan: str, rationale: str = ""
+    ) -> Hypothesis:
+        """Create a hypothesis under the analysis and persist it."""
+        self._validate_analysis_run(insights_run_id)
+        hypothesis = Hypothesis(statement=statement, testing_plan=testing_plan, rationale=rationale)
+        save_to_yaml(
+            self._client,
+            insights_run_id,
+            f"{_HYPOTHESIS_PREFIX}{hypothesis.hypothesis_id}.yaml",
+            hypothesis,
+        )
+        return hypothesis
+
+    def get_hypothesis(self, insights_run_id: str, hypothesis_id: str) -> Hypothesis:
+        """Load a hypothesis by ID from the analysis run."""
+        filename = f"{_HYPOTHESIS_PREFIX}{hypothesis_id}.yaml"
+        try:
+            return load_from_yaml(self._client, insights_run_id, filename, Hypothesis)
+        except Exception as e:
+            raise MlflowException(
+                f"Hypothesis '{hypothesis_id}' not found on run '{insights_run_id}'",
+                error_code=RESOURCE_DOES_NOT_EXIST,
+            ) from e
+
+    def list_hypotheses(
+        self,
+        insights_run_id: str,
+        page_size: int | None = None,
+        page_token: str | None = None,
+    ) -> PagedList[Hypothesis]:
+        """List all hypotheses stored on the analysis run."""
+        filenames = _paginate(
+            list_yaml_files(self._client, insights_run_id, _HYPOTHESIS_PREFIX),
+            page_size,
+            page_token,
+        )
+        return PagedList(
+            [
+                load_from_yaml(self._client, insights_run_id, filename, Hypothesis)
+                for filename in filenames
+            ],
+            filenames.token,
+        )
+
+    def update_hypothesis(
+        self,
+        insights_run_id: str,
+        hypothesis_id: str,
+        status: HypothesisStatus | None = None,
+        evidence: list[tuple[str, str, bool | None]] | None = None,
+    ) -> Hypothesis:
+        """Update a hypothesis' status and/or append evidence tuples."""
+        hypothesis = self.get_hypothesis(insights_run_id, hypothesis_id)
+        if status is not None:
+            hypothesis.status = status
+        if evidence:
+            hypothesis.extend_evidence(evidence)
+        hypothesis.update_timestamp()
+        save_to_yaml(
+            self._client,
+            insights_run_id,
+            f"{_HYPOTHESIS_PREFIX}{hypothesis_id}.yaml",
+            hypothesis,
+        )
+        return hypothesis
+
+    def delete_hypothesis(self, insights_run_id: str, hypothesis_id: str) -> None:
+        """Delete a hypothesis from the analysis run."""
+        delete_yaml_file(self._client, insights_run_id, f"{_HYPOTHESIS_PREFIX}{hypothesis_id}.yaml")
+
+    # -------------------------------------------------------------------- issues
+
+    def create_issue(
+        self,
+        insights_run_id: str,
+        title: str,
+        description: str,
+        severity: IssueSeverity = IssueSeverity.MEDIUM,
+        source_hypothesis_id: str | None = None,
+    ) -> Issue:
+        """Create an issue under the analysis and persist it."""
+        self._validate_analysis_run(insights_run_id)
+        issue = Issue(
+            title=title,
+            description=description,
+            severity=severity,
+            source_hypothesis_id=source_hypothesis_id,
+        )
+        save_to_yaml(self._client, insights_run_id, f"{_ISSUE_PREFIX}{issue.issue_id}.yaml", issue)
+        return issue
+
+    def get_issue(self, insights_run_id: str, issue_id: str) -> Issue:
+        """Load an issue by ID from the analysis run."""
+        filename = f"{_ISSUE_PREFIX}{issue_id}.yaml"
+        try:
+            return load_from_yaml(self._client, insights_run_id, filename, Issue)
+        except Exception as e:
+            raise MlflowException(
+                f"Issue '{issue_id}' not found on run '{insights_run_id}'",
+                error_code=RESOURCE_DOES_NOT_EXIST,
+            ) from e
+
+    def list_issues(
+        self,
+        insights_run_id: str,
+        page_size: int | None = None,
+        page_token: str | None = None,
+    ) -> PagedList[Issue]:
+        """List all issues stored on the analysis run."""
+        filenames = _paginate(
+            list_yaml_files(self._client, insights_run_id, _ISSUE_PREFIX),
+            page_size,
+            page_token,
+        )
+        return PagedList(
+            [
+                load_from_yaml(self._client, insights_run_id, filename, Issue)
+                for filename in filenames
+            ],
+            filenames.token,
+        )
+
+    def update_issue(
+        self,
+        insights_run_id: str,
+        issue_id: str,
+        status: IssueStatus | None = None,
+        evidence: list[tuple[str, str]] | None = None,
+    ) -> Issue:
+        """Update an issue's status and/or append evidence tuples."""
+        issue = self.get_issue(insights_run_id, issue_id)
+        if status is not None:
+            issue.status = status
+        if evidence:
+            issue.extend_evidence(evidence)
+        issue.update_timestamp()
+        save_to_yaml(self._client, insights_run_id, f"{_ISSUE_PREFIX}{issue_id}.yaml", issue)
+        return issue
+
+    # ------------------------------------------------------------------- preview
+
+    def preview_hypotheses(
+        self,
+        experiment_id: str,
+        filter_string: str | None = None,
+        max_traces: int = 100,
+        page_token: str | None = None,
+    ) -> PagedList[Trace]:
+        """Return traces a hypothesis over the experiment would be tested against."""
+        return self._client.search_traces(
+            experiment_ids=[experiment_id],
+            filter_string=filter_string,
+            max_results=max_traces,
+            page_token=page_token,
+            include_spans=False,
+        )
+
+    def preview_issues(
+        self,
+        experiment_id: str,
+        filter_string: str | None = None,
+        max_traces: int = 100,
+        page_token: str | None = None,
+    ) -> PagedList[Trace]:
+        """Return traces an issue over the experiment would reference as evidence."""
+        return self._client.search_traces(
+            experiment_ids=[experiment_id],
+            filter_string=filter_string,
+            max_results=max_traces,
+            page_token=page_token,
+            include_spans=False,
+        )
+
+    # ----------------------------------------------------------------- internals
+
+    def log_sql_query(self, insights_run_id: str, query: str, description: str | None = None):
+        """Record a SQL query used while investigating the analysis."""
+        entry = SqlQueryEntry(query=query, description=description)
+        from mlflow.insights.utils import save_sql_queries_to_yaml
+
+        save_sql_queries_to_yaml(insights_run_id, entry.query, entry.description)
+
+    def _validate_analysis_run(self, insights_run_id: str) -> None:
+        if not validate_run_has_analysis(self._client, insights_run_id):
+            raise MlflowException(
+                f"Run '{insights_run_id}' does not contain an insights analysis",
+                error_code=RESOURCE_DOES_NOT_EXIST,
+            )
@@ -0,0 +1,484 @@
+"""Pydantic models for MLflow Insights analyses, hypotheses, and issues.
+
+An :py:class:`Analysis` groups a set of :py:class:`Hypothesis` objects that are tested
+against trace data. Hypotheses that are validated can be promoted to :py:class:`Issue`
+objects. Evidence for both is recorded as :py:class:`EvidenceEntry` rows pointing at
+individual traces. The ``*Summary`` models are lightweight read-only projections used
+by list endpoints.
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any, Literal
+from uuid import uuid4 as _uuid4
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    TypeAdapter,
+    model_validator,
+)
+
+# Shared configs: these models are constructed in bulk on hot list/load paths, so skip
+# revalidation work that the default pydantic config performs on every attribute access.
+_MUTABLE_CONFIG = ConfigDict(
+    revalidate_instances="never",
+    validate_assignment=False,
+    extra="ignore",
+    arbitrary_types_allowed=False,
+)
+# Models that are off the summary-only hot path defer their pydantic-core schema
+# build from import time to first use, trimming import cost for CLI tools and
+# short-lived workers that only touch the Summary models.
+_DEFERRED_CONFIG = ConfigDict(
+    revalidate_instances="never",
+    validate_assignment=False,
+    extra="ignore",
+    arbitrary_types_allowed=False,
+    defer_build=True,
+)
+# Summary models are immutable value objects; freezing them lets pydantic generate
+# ``__hash__`` and skip assignment validators entirely.
+_FROZEN_CONFIG = ConfigDict(
+    revalidate_instances="never",
+    validate_assignment=False,
+    extra="ignore",
+    arbitrary_types_allowed=False,
+    frozen=True,
+)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _to_epoch_ms(dt: datetime) -> int:
+    return int(dt.timestamp() * 1000)
+
+
+def _from_epoch_ms(ms: int) -> datetime:
+    return datetime.fromtimestamp(ms / 1000, tz=timezone.utc)
+
+
+def _new_id() -> str:
+    # uuid4().hex skips the dashed-string formatting path of str(uuid4()); IDs stay
+    # unique and get four bytes shorter in every serialized artifact.
+    return _uuid4().hex
+
+
+class AnalysisStatus(str, Enum):
+    """Lifecycle state of an analysis."""
+
+    ACTIVE = "ACTIVE"
+    COMPLETED = "COMPLETED"
+    ARCHIVED = "ARCHIVED"
+
+
+class HypothesisStatus(str, Enum):
+    """Outcome state of a hypothesis."""
+
+    TESTING = "TESTING"
+    VALIDATED = "VALIDATED"
+    REFUTED = "REFUTED"
+
+
+class IssueSeverity(str, Enum):
+    """Severity of a confirmed issue."""
+
+    LOW = "LOW"
+    MEDIUM = "MEDIUM"
+    HIGH = "HIGH"
+    CRITICAL = "CRITICAL"
+
+
+class IssueStatus(str, Enum):
+    """Lifecycle state of an issue."""
+
+    OPEN = "OPEN"
+    CONFIRMED = "CONFIRMED"
+    RESOLVED = "RESOLVED"
+    DISMISSED = "DISMISSED"
+
+
+class EvidenceEntry(BaseModel):
+    """A single piece of evidence tying a trace to a hypothesis or issue.
+
+    Entries are immutable value objects: they are created in bulk and never updated,
+    so freezing them removes per-instance assignment machinery and makes them hashable.
+    """
+
+    model_config = _FROZEN_CONFIG
+
+    trace_id: str = Field(description="ID of the trace this evidence points at.")
+    rationale: str = Field(description="Why this trace supports or refutes the claim.")
+    supports: bool | None = Field(
+        default=None,
+        description=(
+            "Whether the trace supports the hypothesis. None for issue evidence, "
+            "where support is implied."
+        ),
+    )
+
+
+class IssueEvidenceEntry(BaseModel):
+    """Evidence attached to an issue; support for the issue is implied.
+
+    ``supports`` is pinned to ``Literal[None]`` so pydantic-core enforces the
+    issue-evidence invariant during validation with no Python-level callback.
+    """
+
+    model_config = _FROZEN_CONFIG
+
+    trace_id: str = Field(description="ID of the trace this evidence points at.")
+    rationale: str = Field(description="Why this trace evidences the issue.")
+    supports: Literal[None] = None  # clint: disable=implicit-optional
+
+
+class Analysis(BaseModel):
+    """Top-level container for a set of hypotheses tested against trace data."""
+
+    model_config = _DEFERRED_CONFIG
+
+    name: str = Field(description="Human-readable name of the analysis.")
+    description: str | None = Field(
+        default=None, description="Optional free-form description of the analysis goal."
+    )
+    status: AnalysisStatus = Field(default=AnalysisStatus.ACTIVE)
+    created_at: datetime = Field(default_factory=_utcnow)
+    updated_at: datetime = Field(default_factory=_utcnow)
+
+    def update_timestamp(self) -> None:
+        self.updated_at = _utcnow()
+
+
+class Hypothesis(BaseModel):
+    """A falsifiable statement about agent behavior, tested against traces."""
+
+    model_config = _MUTABLE_CONFIG
+
+    hypothesis_id: str = Field(default_factory=_new_id)
+    statement: str = Field(description="The hypothesis being tested.")
+    rationale: str = Field(
+        default="", description="Why this hypothesis is worth testing, e.g. supporting data."
+    )
+    testing_plan: str = Field(description="How the hypothesis will be tested.")
+    status: HypothesisStatus = Field(default=HypothesisStatus.TESTING)
+    evidence: list[EvidenceEntry] = Field(default_factory=list)
+    created_at: datetime = Field(default_factory=_utcnow)
+    updated_at: datetime = Field(default_factory=_utcnow)
+
+    @property
+    def trace_count(self) -> int:
+        """Number of distinct traces referenced by this hypothesis's evidence."""
+        return len({entry.trace_id for entry in self.evidence})
+
+    def update_timestamp(self) -> None:
+        self.updated_at = _utcnow()
+
+    def add_evidence(self, trace_id: str, rationale: str, supports: bool | None = None) -> None:
+        """Record a trace as evidence for or against this hypothesis."""
+        self.evidence.append(
+            EvidenceEntry(trace_id=trace_id, rationale=rationale, supports=supports)
+        )
+        self.update_timestamp()
+
+    def extend_evidence(self, entries: Iterable[tuple[str, str, bool | None]]) -> None:
+        """Record many ``(trace_id, rationale, supports)`` evidence tuples at once.
+
+        Batch counterpart of :py:meth:`add_evidence`: entries originate from typed
+        call sites, so they are wrapped with ``model_construct`` and appended with a
+        single ``list.extend`` and one timestamp update instead of N of each.
+        """
+        self.evidence.extend(
+            EvidenceEntry.model_construct(trace_id=trace_id, rationale=rationale, supports=supports)
+            for trace_id, rationale, supports in entries
+        )
+        self.update_timestamp()
+
+
+class Issue(BaseModel):
+    """A confirmed problem surfaced by a validated hypothesis."""
+
+    model_config = _DEFERRED_CONFIG
+
+    issue_id: str = Field(default_factory=_new_id)
+    title: str = Field(description="Short title of the issue.")
+    description: str = Field(description="Detailed description of the issue.")
+    severity: IssueSeverity = Field(description="Severity of the issue.")
+    status: IssueStatus = Field(default=IssueStatus.OPEN)
+    source_hypothesis_id: str | None = Field(
+        default=None, description="ID of the hypothesis this issue was promoted from."
+    )
+    evidence: list[IssueEvidenceEntry] = Field(default_factory=list)
+    assessments: list[str] = Field(
+        default_factory=list, description="Names of assessments associated with this issue."
+    )
+    created_at: datetime = Field(default_factory=_utcnow)
+    updated_at: datetime = Field(default_factory=_utcnow)
+
+    # Mirrors ``assessments`` for O(1) duplicate checks in add_assessment.
+    _assessment_set: set[str] = PrivateAttr(default_factory=set)
+
+    @model_validator(mode="after")
+    def _index_assessments(self) -> "Issue":
+        self._assessment_set = set(self.assessments)
+        return self
+
+    @property
+    def trace_count(self) -> int:
+        """Number of distinct traces referenced by this issue's evidence."""
+        return len({entry.trace_id for entry in self.evidence})
+
+    def update_timestamp(self) -> None:
+        self.updated_at = _utcnow()
+
+    def add_evidence(self, trace_id: str, rationale: str) -> None:
+        """Record a trace as evidence of this issue."""
+        self.evidence.append(
+            IssueEvidenceEntry.model_construct(trace_id=trace_id, rationale=rationale)
+        )
+        self.update_timestamp()
+
+    def extend_evidence(self, entries: Iterable[tuple[str, str]]) -> None:
+        """Record many ``(trace_id, rationale)`` evidence tuples at once.
+
+        Batch counterpart of :py:meth:`add_evidence`; see
+        :py:meth:`Hypothesis.extend_evidence`.
+        """
+        self.evidence.extend(
+            IssueEvidenceEntry.model_construct(trace_id=trace_id, rationale=rationale)
+            for trace_id, rationale in entries
+        )
+        self.update_timestamp()
+
+    def add_assessment(self, assessment: str) -> None:
+        """Associate an assessment name with this issue, ignoring duplicates."""
+        if assessment not in self._assessment_set:
+            self._assessment_set.add(assessment)
+            self.assessments.append(assessment)
+            self.update_timestamp()
+
+
+@dataclass(slots=True, frozen=True)
+class HypothesisSummary:
+    """Read-only projection of a :py:class:`Hypothesis` for list endpoints.
+
+    Summaries are internal DTOs built exclusively from already-validated models, so
+    they are plain frozen dataclasses rather than pydantic models: construction is a
+    straight ``__init__`` with no validation layer.
+    """
+
+    hypothesis_id: str
+    statement: str
+    status: HypothesisStatus
+    created_at_ms: int
+    updated_at_ms: int
+    trace_count: int = 0
+
+    @property
+    def created_at(self) -> datetime:
+        return _from_epoch_ms(self.created_at_ms)
+
+    @property
+    def updated_at(self) -> datetime:
+        return _from_epoch_ms(self.updated_at_ms)
+
+    @classmethod
+    def from_hypothesis(cls, hypothesis: Hypothesis) -> "HypothesisSummary":
+        return cls(
+            hypothesis_id=hypothesis.hypothesis_id,
+            statement=hypothesis.statement,
+            status=hypothesis.status,
+            trace_count=hypothesis.trace_count,
+            created_at_ms=_to_epoch_ms(hypothesis.created_at),
+            updated_at_ms=_to_epoch_ms(hypothesis.updated_at),
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class AnalysisSummary:
+    """Read-only projection of an :py:class:`Analysis` for list endpoints."""
+
+    run_id: str
+    name: str
+    status: AnalysisStatus
+    created_at_ms: int
+    updated_at_ms: int
+    hypothesis_count: int = 0
+    validated_count: int = 0
+    hypotheses: list[HypothesisSummary] = field(default_factory=list)
+
+    @property
+    def created_at(self) -> datetime:
+        return _from_epoch_ms(self.created_at_ms)
+
+    @property
+    def updated_at(self) -> datetime:
+        return _from_epoch_ms(self.updated_at_ms)
+
+    @classmethod
+    def from_analysis(
+        cls,
+        analysis: Analysis,
+        run_id: str,
+        hypotheses: list[HypothesisSummary] | None = None,
+    ) -> "AnalysisSummary":
+        if hypotheses is None:
+            hypotheses = []
+        return cls(
+            run_id=run_id,
+            name=analysis.name,
+            status=analysis.status,
+            hypothesis_count=len(hypotheses),
+            validated_count=sum(1 for h in hypotheses if h.status == HypothesisStatus.VALIDATED),
+            hypotheses=hypotheses,
+            created_at_ms=_to_epoch_ms(analysis.created_at),
+            updated_at_ms=_to_epoch_ms(analysis.updated_at),
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class IssueSummary:
+    """Read-only projection of an :py:class:`Issue` for list endpoints."""
+
+    issue_id: str
+    title: str
+    severity: IssueSeverity
+    status: IssueStatus
+    created_at_ms: int
+    updated_at_ms: int
+    trace_count: int = 0
+
+    @property
+    def created_at(self) -> datetime:
+        return _from_epoch_ms(self.created_at_ms)
+
+    @property
+    def updated_at(self) -> datetime:
+        return _from_epoch_ms(self.updated_at_ms)
+
+    @classmethod
+    def from_issue(cls, issue: Issue) -> "IssueSummary":
+        return cls(
+            issue_id=issue.issue_id,
+            title=issue.title,
+            severity=issue.severity,
+            status=issue.status,
+            trace_count=issue.trace_count,
+            created_at_ms=_to_epoch_ms(issue.created_at),
+            updated_at_ms=_to_epoch_ms(issue.updated_at),
+        )
+
+
+class BaselineCensusMetadata(BaseModel):
+    """Provenance of a baseline census: what was scanned and when."""
+
+    model_config = _DEFERRED_CONFIG
+
+    experiment_ids: list[str] = Field(default_factory=list)
+    start_time: datetime | None = Field(
+        default=None, description="Start of the census time window."
+    )
+    end_time: datetime | None = Field(default=None, description="End of the census time window.")
+    generated_at: datetime = Field(default_factory=_utcnow)
+
+
+class BaselineCensusOperationalMetrics(BaseModel):
+    """Operational health metrics collected by a baseline census."""
+
+    model_config = _DEFERRED_CONFIG
+
+    total_traces: int = 0
+    error_count: int = 0
+    error_rate: float = 0.0
+    latency_p50_ms: float | None = None
+    latency_p90_ms: float | None = None
+    latency_p99_ms: float | None = None
+    top_error_spans: list[dict[str, Any]] = Field(default_factory=list)
+    top_slow_tools: list[dict[str, Any]] = Field(default_factory=list)
+    time_buckets: list[dict[str, Any]] = Field(default_factory=list)
+    error_sample_trace_ids: list[str] = Field(default_factory=list)
+
+
+class BaselineCensusQualityMetrics(BaseModel):
+    """Quality metrics (assessments and scores) collected by a baseline census."""
+
+    model_config = _DEFERRED_CONFIG
+
+    assessment_counts: dict[str, int] = Field(default_factory=dict)
+    average_scores: dict[str, float] = Field(default_factory=dict)
+    flagged_trace_ids: list[str] = Field(default_factory=list)
+
+
+class BaselineCensus(BaseModel):
+    """Snapshot of baseline operational and quality metrics for an experiment."""
+
+    model_config = _DEFERRED_CONFIG
+
+    metadata: BaselineCensusMetadata
+    operational_metrics: BaselineCensusOperationalMetrics = Field(
+        default_factory=BaselineCensusOperationalMetrics
+    )
+    quality_metrics: BaselineCensusQualityMetrics = Field(
+        default_factory=BaselineCensusQualityMetrics
+    )
+
+    @classmethod
+    def from_trusted_dict(cls, data: dict[str, Any]) -> "BaselineCensus":
+        """Build a census from data this process previously serialized itself.
+
+        The census file embeds large ``list[dict]`` payloads (top_error_spans,
+        time_buckets, ...) that dominate validation time when loaded through
+        ``model_validate``. Census files are written exclusively by MLflow and read
+        back from the run's own artifacts, so this loader wraps the decoded mapping
+        with ``model_construct`` and skips the recursive re-validation entirely.
+        Use ``model_validate`` for data from any other source.
+        """
+        metadata = BaselineCensusMetadata.model_validate(data.get("metadata", {}))
+        return cls.model_construct(
+            metadata=metadata,
+            operational_metrics=BaselineCensusOperationalMetrics.model_construct(
+                **data.get("operational_metrics", {})
+            ),
+            quality_metrics=BaselineCensusQualityMetrics.model_construct(
+                **data.get("quality_metrics", {})
+            ),
+        )
+
+
+class SqlQueryEntry(BaseModel):
+    """A SQL query logged while computing an analysis, kept for reproducibility."""
+
+    model_config = _MUTABLE_CONFIG
+
+    timestamp: datetime = Field(default_factory=_utcnow)
+    query: str = Field(description="The SQL statement that was executed.")
+    description: str | None = Field(default=None, description="What the query computed.")
+
+
+# Serialization fast paths for the list endpoints. The adapters are compiled once at
+# import and encode/decode entire summary lists inside pydantic-core, skipping the
+# per-model Python dict materialization of model_dump() + json.dumps().
+_ANALYSIS_SUMMARY_LIST_ADAPTER = TypeAdapter(list[AnalysisSummary])
+_HYPOTHESIS_SUMMARY_LIST_ADAPTER = TypeAdapter(list[HypothesisSummary])
+_ISSUE_SUMMARY_LIST_ADAPTER = TypeAdapter(list[IssueSummary])
+
+_SUMMARY_LIST_ADAPTERS = {
+    AnalysisSummary: _ANALYSIS_SUMMARY_LIST_ADAPTER,
+    HypothesisSummary: _HYPOTHESIS_SUMMARY_LIST_ADAPTER,
+    IssueSummary: _ISSUE_SUMMARY_LIST_ADAPTER,
+}
+
+
+def summaries_to_json(summary_type: type, summaries: list[Any]) -> bytes:
+    """Serialize a list of summary DTOs to JSON bytes in a single pydantic-core pass."""
+    return _SUMMARY_LIST_ADAPTERS[summary_type].dump_json(summaries)
+
+
+def summaries_from_json(summary_type: type, data: bytes | str) -> list[Any]:
+    """Deserialize JSON bytes produced by :py:func:`summaries_to_json`."""
+    return _SUMMARY_LIST_ADAPTERS[summary_type].validate_json(data)
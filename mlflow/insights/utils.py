@@ -0,0 +1,541 @@
+"""Utilities for persisting insights artifacts and managing insights runs.
+
+Insights state is stored as YAML artifacts under the ``insights/`` directory of an
+MLflow run. Each experiment has a single "parent" insights run (tagged with
+``mlflow.insights.type = "parent"``) under which individual analysis runs are nested.
+"""
+
+import atexit
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from datetime import datetime, timezone
+from typing import Any
+
+import yaml
+from pydantic import BaseModel
+
+try:
+    from yaml import CSafeDumper as YamlSafeDumper
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeDumper as YamlSafeDumper
+    from yaml import SafeLoader as YamlSafeLoader
+
+import mlflow
+from mlflow.entities import Run, RunTag, ViewType
+from mlflow.tracking import MlflowClient
+from mlflow.tracking.artifact_utils import get_artifact_repository
+
+_logger = logging.getLogger(__name__)
+
+INSIGHTS_ARTIFACT_DIR = "insights"
+INSIGHTS_TYPE_TAG = "mlflow.insights.type"
+INSIGHTS_PARENT_TYPE = "parent"
+INSIGHTS_ANALYSIS_TYPE = "analysis"
+INSIGHTS_PARENT_RUN_NAME = "Insights"
+MLFLOW_PARENT_RUN_ID_TAG = "mlflow.parentRunId"
+
+ANALYSIS_FILENAME = "analysis.yaml"
+SQL_QUERIES_FILENAME = "sql_queries.yaml"
+
+# Process-local memo of experiment_id -> insights parent run_id. The parent run is a
+# tag-filtered singleton per experiment, so after the first lookup (or creation) we
+# can skip the search_runs round-trip entirely.
+_PARENT_RUN_CACHE: dict[str, str] = {}
+_PARENT_RUN_CACHE_LOCK = threading.Lock()
+
+# Last experiment id passed to mlflow.set_experiment by this module. set_experiment
+# does a get_experiment REST call on every invocation, so skip it when unchanged.
+_LAST_SET_EXPERIMENT: str | None = None
+
+
+_CLIENT: MlflowClient | None = None
+
+
+def _get_client() -> MlflowClient:
+    """Return a lazily-created module-level MlflowClient.
+
+    Constructing a client re-resolves the tracking URI and creates a fresh HTTP
+    session per instance; reusing one keeps TCP connections alive across calls.
+    """
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = MlflowClient()
+    return _CLIENT
+
+
+def _ensure_experiment(experiment_id: str) -> None:
+    global _LAST_SET_EXPERIMENT
+    if _LAST_SET_EXPERIMENT != experiment_id:
+        mlflow.set_experiment(experiment_id=experiment_id)
+        _LAST_SET_EXPERIMENT = experiment_id
+
+
+# Reusable staging directory for artifact uploads. Creating and tearing down a fresh
+# temp directory per write dominates syscall cost on hot analysis loops; instead we
+# stage files here, unlink them after upload, and remove the directory at exit.
+# Files are staged under a per-run subdirectory: artifact filenames are fixed
+# (analysis.yaml, sql_queries.yaml, ...), so concurrent saves for different runs
+# would otherwise overwrite each other's staged file before log_artifact reads it.
+_STAGING_DIR = tempfile.mkdtemp(prefix="mlflow_insights_")
+atexit.register(shutil.rmtree, _STAGING_DIR, ignore_errors=True)
+
+
+def _staging_path(run_id: str, filename: str) -> str:
+    run_dir = os.path.join(_STAGING_DIR, run_id)
+    os.makedirs(run_dir, exist_ok=True)
+    return os.path.join(run_dir, filename)
+
+
+# Pending SQL query entries per run_id, flushed to the sql_queries.yaml artifact by
+# flush_sql_queries (and at interpreter exit as a safety net).
+_SQL_QUERY_BUFFER: dict[str, list[dict[str, Any]]] = {}
+_SQL_QUERY_BUFFER_LOCK = threading.Lock()
+
+# Cache of (run_id, artifact_dir) -> tuple of artifact paths. Listing artifacts is a
+# REST round-trip, and callers filter the same listing with several prefixes in a
+# row; entries are invalidated whenever this module writes or deletes an artifact.
+_ARTIFACT_LIST_CACHE: dict[tuple[str, str], tuple[str, ...]] = {}
+_ARTIFACT_LIST_CACHE_LOCK = threading.Lock()
+
+# Bounded memo of run_id -> tag dict used when classifying runs; evicts in FIFO
+# order once full. Run tags relevant here (insights type, parent id) are immutable
+# after run creation, so no TTL is needed.
+_RUN_TAGS_CACHE: dict[str, dict[str, str]] = {}
+_RUN_TAGS_CACHE_LOCK = threading.Lock()
+_RUN_TAGS_CACHE_MAXSIZE = 1024
+
+
+def _list_artifacts_cached(client: MlflowClient, run_id: str, path: str) -> tuple[str, ...]:
+    key = (run_id, path)
+    with _ARTIFACT_LIST_CACHE_LOCK:
+        cached = _ARTIFACT_LIST_CACHE.get(key)
+    if cached is not None:
+        return cached
+    paths = tuple(artifact.path for artifact in client.list_artifacts(run_id, path))
+    with _ARTIFACT_LIST_CACHE_LOCK:
+        _ARTIFACT_LIST_CACHE[key] = paths
+    return paths
+
+
+def _invalidate_artifact_cache(run_id: str) -> None:
+    with _ARTIFACT_LIST_CACHE_LOCK:
+        for key in [k for k in _ARTIFACT_LIST_CACHE if k[0] == run_id]:
+            del _ARTIFACT_LIST_CACHE[key]
+
+
+def save_to_yaml(client: MlflowClient, run_id: str, filename: str, model: BaseModel) -> None:
+    """Serialize a pydantic model to YAML and log it under the run's insights directory."""
+    local_path = _staging_path(run_id, filename)
+    try:
+        with open(local_path, "w") as f:
+            yaml.dump(
+                model.model_dump(mode="json"), f, Dumper=YamlSafeDumper, default_flow_style=False
+            )
+        client.log_artifact(run_id, local_path, INSIGHTS_ARTIFACT_DIR)
+        _invalidate_artifact_cache(run_id)
+    finally:
+        if os.path.exists(local_path):
+            os.unlink(local_path)
+
+
+def load_from_yaml(
+    client: MlflowClient, run_id: str, filename: str, model_class: type[BaseModel]
+) -> BaseModel:
+    """Download a YAML artifact from the run's insights directory and validate it."""
+    local_path = client.download_artifacts(run_id, f"{INSIGHTS_ARTIFACT_DIR}/{filename}")
+    with open(local_path) as f:
+        data = yaml.load(f, Loader=YamlSafeLoader)
+    return model_class.model_validate(data)
+
+
+def save_to_json(client: MlflowClient, run_id: str, filename: str, model: BaseModel) -> None:
+    """Serialize a pydantic model to JSON and log it under the run's insights directory.
+
+    JSON fast path for machine-read state: ``model_dump_json`` serializes in
+    pydantic-core without building an intermediate dict tree, which is an order of
+    magnitude faster than YAML emission for large analyses.
+    """
+    local_path = _staging_path(run_id, filename)
+    try:
+        with open(local_path, "wb") as f:
+            f.write(model.model_dump_json(indent=2).encode())
+        client.log_artifact(run_id, local_path, INSIGHTS_ARTIFACT_DIR)
+        _invalidate_artifact_cache(run_id)
+    finally:
+        if os.path.exists(local_path):
+            os.unlink(local_path)
+
+
+def load_from_json(
+    client: MlflowClient, run_id: str, filename: str, model_class: type[BaseModel]
+) -> BaseModel:
+    """Download a JSON artifact from the run's insights directory and validate it."""
+    local_path = client.download_artifacts(run_id, f"{INSIGHTS_ARTIFACT_DIR}/{filename}")
+    with open(local_path, "rb") as f:
+        return model_class.model_validate_json(f.read())
+
+
+def save_sql_queries_to_yaml(run_id: str, query: str, description: str | None = None) -> None:
+    """Record a SQL query against the run's ``sql_queries.yaml`` artifact.
+
+    Queries are buffered in memory and written out by :py:func:`flush_sql_queries`
+    (also registered via ``atexit``), so logging a query is a cheap list append
+    instead of a download-append-reupload cycle per call.
+    """
+    with _SQL_QUERY_BUFFER_LOCK:
+        _SQL_QUERY_BUFFER.setdefault(run_id, []).append(
+            {
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "query": query,
+                "description": description,
+            }
+        )
+
+
+def flush_sql_queries(run_id: str, client: MlflowClient | None = None) -> None:
+    """Flush buffered SQL queries for the run to its ``sql_queries.yaml`` artifact."""
+    with _SQL_QUERY_BUFFER_LOCK:
+        pending = _SQL_QUERY_BUFFER.pop(run_id, None)
+    if not pending:
+        return
+    client = client or _get_client()
+    entries: list[dict[str, Any]] = []
+    try:
+        local_path = client.download_artifacts(
+            run_id, f"{INSIGHTS_ARTIFACT_DIR}/{SQL_QUERIES_FILENAME}"
+        )
+        with open(local_path) as f:
+            entries = yaml.load(f, Loader=YamlSafeLoader) or []
+    except Exception:
+        # No queries logged yet for this run.
+        pass
+    entries.extend(pending)
+    staged_path = _staging_path(run_id, SQL_QUERIES_FILENAME)
+    try:
+        with open(staged_path, "w") as f:
+            yaml.dump(entries, f, Dumper=YamlSafeDumper, default_flow_style=False)
+        client.log_artifact(run_id, staged_path, INSIGHTS_ARTIFACT_DIR)
+        _invalidate_artifact_cache(run_id)
+    finally:
+        if os.path.exists(staged_path):
+            os.unlink(staged_path)
+
+
+def _flush_all_sql_queries() -> None:
+    for run_id in list(_SQL_QUERY_BUFFER):
+        try:
+            flush_sql_queries(run_id)
+        except Exception as e:
+            _logger.warning("Failed to flush SQL queries for run %s: %s", run_id, e)
+
+
+atexit.register(_flush_all_sql_queries)
+
+
+def delete_yaml_file(client: MlflowClient, run_id: str, filename: str) -> None:
+    """Delete a YAML artifact from the run's insights directory."""
+    run = client.get_run(run_id)
+    repo = get_artifact_repository(run.info.artifact_uri)
+    repo.delete_artifacts(f"{INSIGHTS_ARTIFACT_DIR}/{filename}")
+    _invalidate_artifact_cache(run_id)
+
+
+def list_yaml_files(client: MlflowClient, run_id: str, prefix: str = "") -> list[str]:
+    """List YAML file names under the run's insights directory matching ``prefix``."""
+    paths = _list_artifacts_cached(client, run_id, INSIGHTS_ARTIFACT_DIR)
+    out = []
+    for path in paths:
+        name = path.rpartition("/")[2]
+        if name.startswith(prefix) and name.endswith(".yaml"):
+            out.append(name)
+    return out
+
+
+def validate_run_has_analysis(client: MlflowClient, run_id: str) -> bool:
+    """Return True if the run has an ``insights/analysis.yaml`` artifact."""
+    try:
+        paths = _list_artifacts_cached(client, run_id, INSIGHTS_ARTIFACT_DIR)
+    except Exception:
+        return False
+    target = f"{INSIGHTS_ARTIFACT_DIR}/{ANALYSIS_FILENAME}"
+    return any(path == target or path.endswith(f"/{ANALYSIS_FILENAME}") for path in paths)
+
+
+def _get_run_tags(client: MlflowClient, run_id: str) -> dict[str, str]:
+    """Return the run's tag dict, memoized per run_id.
+
+    Classifying candidate runs reads one tag per run but ``get_run`` pulls the full
+    record (params, metrics, tags); cache the tag dict so repeated checks across the
+    same runs fetch each record once.
+    """
+    with _RUN_TAGS_CACHE_LOCK:
+        cached = _RUN_TAGS_CACHE.get(run_id)
+    if cached is not None:
+        return cached
+    tags = client.get_run(run_id).data.tags
+    with _RUN_TAGS_CACHE_LOCK:
+        if len(_RUN_TAGS_CACHE) >= _RUN_TAGS_CACHE_MAXSIZE:
+            _RUN_TAGS_CACHE.pop(next(iter(_RUN_TAGS_CACHE)))
+        _RUN_TAGS_CACHE[run_id] = tags
+    return tags
+
+
+def is_insights_parent_run(
+    client: MlflowClient, run_id: str, known_tags: dict[str, str] | None = None
+) -> bool:
+    """Return True if the run is an insights parent run.
+
+    Callers that already hold the run's tags (e.g. from ``search_runs``) can pass
+    them via ``known_tags`` to skip the fetch entirely.
+    """
+    tags = known_tags if known_tags is not None else _get_run_tags(client, run_id)
+    return tags.get(INSIGHTS_TYPE_TAG) == INSIGHTS_PARENT_TYPE
+
+
+def get_parent_run_id(
+    client: MlflowClient, run_id: str, known_tags: dict[str, str] | None = None
+) -> str | None:
+    """Return the ID of the run's parent run, if any."""
+    tags = known_tags if known_tags is not None else _get_run_tags(client, run_id)
+    return tags.get(MLFLOW_PARENT_RUN_ID_TAG)
+
+
+def get_or_create_parent_run(client: MlflowClient, experiment_id: str) -> str:
+    """Return the experiment's insights parent run ID, creating the run if needed.
+
+    The result is memoized per process: the parent run is a singleton per
+    experiment, so the tag-filtered ``search_runs`` round-trip only happens once.
+    """
+    cached = _PARENT_RUN_CACHE.get(experiment_id)
+    if cached is not None:
+        return cached
+
+    _ensure_experiment(experiment_id)
+    runs = client.search_runs(
+        experiment_ids=[experiment_id],
+        filter_string=f"tags.`{INSIGHTS_TYPE_TAG}` = '{INSIGHTS_PARENT_TYPE}'",
+        run_view_type=ViewType.ACTIVE_ONLY,
+        max_results=1,
+    )
+    if runs:
+        parent_run_id = runs[0].info.run_id
+    else:
+        with mlflow.start_run(run_name=INSIGHTS_PARENT_RUN_NAME) as run:
+            parent_run_id = run.info.run_id
+            # Batch the tag writes into a single log_batch call instead of one
+            # REST round-trip per mlflow.set_tag.
+            client.log_batch(
+                run_id=parent_run_id,
+                tags=[
+                    RunTag(INSIGHTS_TYPE_TAG, INSIGHTS_PARENT_TYPE),
+                    RunTag("mlflow.note.content", "Parent run for MLflow insights analyses."),
+                ],
+            )
+
+    with _PARENT_RUN_CACHE_LOCK:
+        _PARENT_RUN_CACHE[experiment_id] = parent_run_id
+    return parent_run_id
+
+
+def clear_parent_run_cache() -> None:
+    """Drop all memoized parent run IDs (used when runs are deleted in tests)."""
+    global _LAST_SET_EXPERIMENT
+    with _PARENT_RUN_CACHE_LOCK:
+        _PARENT_RUN_CACHE.clear()
+    _LAST_SET_EXPERIMENT = None
+
+
+def create_nested_analysis_run(
+    client: MlflowClient,
+    experiment_id: str,
+    run_name: str,
+    parent_run_id: str | None = None,
+) -> str:
+    """Create an analysis run nested under the experiment's insights parent run.
+
+    Callers that already know the parent run ID can pass it to skip the
+    ``get_or_create_parent_run`` lookup entirely.
+    """
+    if parent_run_id is None:
+        parent_run_id = get_or_create_parent_run(client, experiment_id)
+    _ensure_experiment(experiment_id)
+    with mlflow.start_run(run_name=run_name, parent_run_id=parent_run_id) as run:
+        mlflow.set_tag(INSIGHTS_TYPE_TAG, INSIGHTS_ANALYSIS_TYPE)
+        return run.info.run_id
+
+
+def list_analysis_runs(client: MlflowClient, experiment_id: str) -> list[Run]:
+    """List all analysis runs in the experiment, newest first.
+
+    Pages through ``search_runs`` explicitly so experiments with more analyses
+    than one server page are not silently truncated.
+    """
+    runs: list[Run] = []
+    page_token = None
+    while True:
+        page = client.search_runs(
+            experiment_ids=[experiment_id],
+            filter_string=f"tags.`{INSIGHTS_TYPE_TAG}` = '{INSIGHTS_ANALYSIS_TYPE}'",
+            run_view_type=ViewType.ACTIVE_ONLY,
+            max_results=1000,
+            order_by=["attributes.start_time DESC"],
+            page_token=page_token,
+        )
+        runs.extend(page)
+        page_token = page.token
+        if not page_token:
+            return runs
+
+
+def list_analysis_run_ids(client: MlflowClient, experiment_id: str) -> list[str]:
+    """List the IDs of all analysis runs in the experiment.
+
+    Prefer this over :py:func:`list_analysis_runs` when only the IDs are needed:
+    the full runs hydrate every param/metric/tag, which dominates search_runs cost.
+    """
+    return [run.info.run_id for run in list_analysis_runs(client, experiment_id)]
+
+
+class AnalysisReportManager:
+    """Builds the human-readable markdown report for an analysis.
+
+    The report is a fixed sequence of ``##``-level sections held as a
+    ``section name -> list of rendered entries`` mapping; adding a finding is an
+    O(len(entry)) append rather than a search-and-splice over the whole document.
+    Markdown is rendered in one pass by :py:meth:`save` / :py:meth:`finalize_report`.
+    """
+
+    _SECTION_ORDER = (
+        "Executive Summary",
+        "Operational Issues",
+        "Quality Issues",
+        "Strengths",
+        "Refuted Hypotheses",
+        "Summary Statistics",
+        "Recommendations",
+        "Conclusion",
+    )
+
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+        self._analysis_name: str | None = None
+        self._sections: dict[str, list[str]] = {name: [] for name in self._SECTION_ORDER}
+        self._loaded = False
+
+    def create_report(self, analysis_name: str) -> None:
+        """Initialize the report with its placeholder sections and write it out."""
+        self._analysis_name = analysis_name
+        self._sections = {name: [] for name in self._SECTION_ORDER}
+        self._sections["Executive Summary"].append("{executive_summary}")
+        self._sections["Summary Statistics"].append("{statistics}")
+        self._sections["Recommendations"].append("{recommendations}")
+        self._sections["Conclusion"].append("{conclusion}")
+        self._loaded = True
+        self.save()
+
+    def _load(self) -> None:
+        """Parse an existing report file back into the section mapping (single pass)."""
+        if self._loaded:
+            return
+        with open(self.filepath) as f:
+            content = f.read()
+        head, _, rest = content.partition("\n## ")
+        if head.startswith("# Analysis Report: "):
+            self._analysis_name = head[len("# Analysis Report: ") :].strip()
+        for block in rest.split("\n## ") if rest else []:
+            name, _, body = block.partition("\n")
+            body = body.strip("\n")
+            if name in self._sections and body:
+                # Split the body back into its "### "-headed entries so appends and
+                # counters keep per-entry granularity across a save/reload cycle.
+                first, *entries = body.split("\n### ")
+                self._sections[name] = ([first.strip("\n")] if first.strip("\n") else []) + [
+                    f"### {entry.strip()}" for entry in entries
+                ]
+        self._loaded = True
+
+    def _render(self) -> str:
+        parts = [f"# Analysis Report: {self._analysis_name}"]
+        for name in self._SECTION_ORDER:
+            entries = self._sections[name]
+            parts.append(f"## {name}" + ("\n\n" + "\n\n".join(entries) if entries else ""))
+        return "\n\n".join(parts) + "\n"
+
+    def _write_text(self, content: str) -> None:
+        # Write-to-sibling + os.replace keeps the report intact if the process dies
+        # mid-write; a single buffered write avoids per-line write syscalls.
+        tmp = self.filepath + ".tmp"
+        with open(tmp, "w", buffering=1 << 20) as f:
+            f.write(content)
+        os.replace(tmp, self.filepath)
+
+    def save(self) -> None:
+        """Render the report to markdown and flush it to disk."""
+        self._load()
+        self._write_text(self._render())
+
+    def add_issue(
+        self,
+        title: str,
+        severity: str,
+        category: str,
+        description: str,
+        evidence: list[dict[str, Any]],
+    ) -> None:
+        """Append an issue entry to the operational or quality issues section."""
+        self._load()
+
+        def fmt(ev: dict[str, Any]) -> str:
+            trace_id = ev.get("trace_id", "unknown")
+            if category == "operational" and "latency_ms" in ev:
+                header = f"- **{trace_id}** ({ev['latency_ms']}ms)"
+            else:
+                header = f"- **{trace_id}**"
+            parts = [
+                header,
+                f'  - Request: "{ev.get("request", "")}"',
+                f'  - Response: "{ev.get("response", "")}"',
+            ]
+            if ev.get("rationale"):
+                parts.append(f"  - Rationale: {ev['rationale']}")
+            return "\n".join(parts)
+
+        evidence_text = "\n".join(fmt(ev) for ev in evidence)
+        entry = f"### {title} [{severity}]\n\n{description}\n\n{evidence_text}"
+        section = "Operational Issues" if category == "operational" else "Quality Issues"
+        self._sections[section].append(entry)
+
+    def add_strength(self, title: str, description: str) -> None:
+        """Append a strength entry to the strengths section."""
+        self._load()
+        self._sections["Strengths"].append(f"### {title}\n\n{description}")
+
+    def add_refuted_hypothesis(self, statement: str, rationale: str) -> None:
+        """Append a refuted hypothesis entry to its section."""
+        self._load()
+        self._sections["Refuted Hypotheses"].append(f"### {statement}\n\n{rationale}")
+
+    def operational_issue_count(self) -> int:
+        self._load()
+        return len(self._sections["Operational Issues"])
+
+    def finalize_report(
+        self,
+        executive_summary: str,
+        statistics: dict[str, Any],
+        recommendations: list[str],
+        conclusion: str,
+    ) -> None:
+        """Fill in the summary sections and write the final report."""
+        self._load()
+        stats_text = "\n".join(f"- **{key}**: {value}" for key, value in statistics.items())
+        rec_text = "\n".join(f"- {rec}" for rec in recommendations)
+        self._sections["Executive Summary"] = [executive_summary]
+        self._sections["Summary Statistics"] = [stats_text]
+        self._sections["Recommendations"] = [rec_text]
+        self._sections["Conclusion"] = [conclusion]
+        self._write_text(self._render())
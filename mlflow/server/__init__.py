@@ -20,7 +20,7 @@ from mlflow.environment_variables import (
     MLFLOW_SERVER_ENABLE_JOB_EXECUTION,
 )
 from mlflow.exceptions import MlflowException
-from mlflow.server import handlers
+from mlflow.server import agentic_rest_handlers, handlers
 from mlflow.server.handlers import (
     STATIC_PREFIX_ENV_VAR,
     _add_static_prefix,
@@ -61,6 +61,9 @@ IS_FLASK_V1 = Version(importlib.metadata.version("flask")) < Version("2.0")
 for http_path, handler, methods in handlers.get_endpoints():
     app.add_url_rule(http_path, handler.__name__, handler, methods=methods)
 
+for http_path, handler, methods in agentic_rest_handlers.get_endpoints():
+    app.add_url_rule(http_path, handler.__name__, handler, methods=methods)
+
 if os.getenv(PROMETHEUS_EXPORTER_ENV_VAR):
     from mlflow.server.prometheus_exporter import activate_prometheus_exporter
 
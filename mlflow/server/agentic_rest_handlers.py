@@ -0,0 +1,486 @@
+"""REST handlers for agentic access to MLflow Insights.
+
+These endpoints expose read-only views of insights analyses, hypotheses, and issues
+(see :py:mod:`mlflow.insights`) for agent tooling. They live outside the
+protobuf-generated service handlers because the insights API is YAML-artifact-backed
+rather than proto-backed.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from cachetools import TTLCache
+from flask import Response, request
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from werkzeug.exceptions import BadRequest, NotFound
+
+from mlflow.exceptions import MlflowException
+from mlflow.insights.client import InsightsClient
+from mlflow.insights.models import Analysis, AnalysisSummary, Hypothesis, Issue
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+from mlflow.server.handlers import _disable_if_artifacts_only, catch_mlflow_exception
+
+_logger = logging.getLogger(__name__)
+
+_PREFIX = "/api/3.0/mlflow/traces/insights/agentic"
+
+# Per-thread InsightsClient: constructing one per request re-resolves the tracking
+# URI and rebuilds HTTP session state before the single SDK call each handler makes,
+# while a process-wide singleton would funnel every worker thread through one
+# connection. One client per worker thread keeps HTTP keep-alive working without
+# cross-thread sharing or locking.
+_CLIENT_LOCAL = threading.local()
+
+
+# Short-TTL memo of SDK read results for the list/get handlers: UI polling and
+# re-navigation re-issue identical requests within seconds. Bounded so large
+# result blobs cannot grow memory without limit.
+_SDK_CACHE = TTLCache(maxsize=256, ttl=30)
+_SDK_CACHE_LOCK = threading.Lock()
+
+
+def _cached_sdk_call(key, call):
+    with _SDK_CACHE_LOCK:
+        hit = _SDK_CACHE.get(key)
+    if hit is not None:
+        return hit
+    result = call()
+    with _SDK_CACHE_LOCK:
+        _SDK_CACHE[key] = result
+    return result
+
+
+def _get_insights_client() -> InsightsClient:
+    client = getattr(_CLIENT_LOCAL, "client", None)
+    if client is None:
+        client = _CLIENT_LOCAL.client = InsightsClient()
+    return client
+
+
+_MAX_PAGE_SIZE = 1000
+
+
+class ListAnalysesRequest(BaseModel):
+    experiment_id: str
+    page_size: int = 100
+    page_token: str | None = None
+
+
+class ListAnalysesResponse(BaseModel):
+    analyses: list[AnalysisSummary]
+    next_page_token: str | None = None
+
+
+class GetAnalysisRequest(BaseModel):
+    insights_run_id: str
+
+
+class GetAnalysisResponse(BaseModel):
+    analysis: Analysis
+
+
+class ListHypothesesRequest(BaseModel):
+    insights_run_id: str
+    page_size: int = 100
+    page_token: str | None = None
+
+
+class ListHypothesesResponse(BaseModel):
+    hypotheses: list[Hypothesis]
+    next_page_token: str | None = None
+
+
+class GetHypothesisRequest(BaseModel):
+    insights_run_id: str
+    hypothesis_id: str
+
+
+class GetHypothesisResponse(BaseModel):
+    hypothesis: Hypothesis
+
+
+class BatchGetHypothesesRequest(BaseModel):
+    insights_run_id: str
+    hypothesis_ids: list[str]
+
+
+class BatchGetHypothesesResponse(BaseModel):
+    hypotheses: list[Hypothesis]
+
+
+class TraceSummary(BaseModel):
+    """Typed, precompiled schema for the trace entries in preview responses."""
+
+    trace_id: str
+    request_id: str
+    status: str | None = None
+    execution_time_ms: int | None = None
+    timestamp: int | None = None
+
+
+class PreviewHypothesesRequest(BaseModel):
+    experiment_id: str
+    filter_string: str | None = None
+    page_size: int = 100
+    page_token: str | None = None
+
+
+class PreviewHypothesesResponse(BaseModel):
+    traces: list[TraceSummary]
+    total_count: int
+    returned_count: int
+    next_page_token: str | None = None
+
+
+class ListIssuesRequest(BaseModel):
+    insights_run_id: str
+    page_size: int = 100
+    page_token: str | None = None
+
+
+class ListIssuesResponse(BaseModel):
+    issues: list[Issue]
+    next_page_token: str | None = None
+
+
+class GetIssueRequest(BaseModel):
+    insights_run_id: str
+    issue_id: str
+
+
+class GetIssueResponse(BaseModel):
+    issue: Issue
+
+
+class PreviewIssuesRequest(BaseModel):
+    experiment_id: str
+    filter_string: str | None = None
+    page_size: int = 100
+    page_token: str | None = None
+
+
+class PreviewIssuesResponse(BaseModel):
+    traces: list[TraceSummary]
+    total_count: int
+    returned_count: int
+    next_page_token: str | None = None
+
+
+def _trace_to_summary(trace) -> TraceSummary:
+    """Convert a Trace to the preview payload entry without validation.
+
+    Binds ``trace.info`` and ``request_id`` to locals once so each trace costs a
+    fixed four attribute reads instead of re-walking the attribute chains.
+    """
+    info = trace.info
+    rid = info.request_id
+    status = info.status
+    return TraceSummary.model_construct(
+        trace_id=rid,
+        request_id=rid,
+        status=status.value if status else None,
+        execution_time_ms=info.execution_time_ms,
+        timestamp=info.timestamp_ms,
+    )
+
+
+# Request validators compiled once at import: TypeAdapter.validate_python dispatches
+# straight into pydantic-core, skipping the per-call model lookup and Python keyword
+# unpacking of Model(**data).
+_LIST_ANALYSES = TypeAdapter(ListAnalysesRequest)
+_GET_ANALYSIS = TypeAdapter(GetAnalysisRequest)
+_LIST_HYPOTHESES = TypeAdapter(ListHypothesesRequest)
+_GET_HYPOTHESIS = TypeAdapter(GetHypothesisRequest)
+_BATCH_GET_HYPOTHESES = TypeAdapter(BatchGetHypothesesRequest)
+_PREVIEW_HYPOTHESES = TypeAdapter(PreviewHypothesesRequest)
+_LIST_ISSUES = TypeAdapter(ListIssuesRequest)
+_GET_ISSUE = TypeAdapter(GetIssueRequest)
+_PREVIEW_ISSUES = TypeAdapter(PreviewIssuesRequest)
+
+
+def _parse_request_body() -> dict[str, Any]:
+    """Parse the request body without Flask's mimetype checks and request-object caching.
+
+    These handlers read the body exactly once, so ``get_json``'s cached parse and
+    content-type negotiation are pure overhead for the small payloads involved.
+    """
+    if not request.content_length:
+        return {}
+    try:
+        return json.loads(request.get_data(cache=False))
+    except ValueError as e:
+        raise BadRequest(f"Invalid JSON request body: {e}") from e
+
+
+def _stream_preview(traces, next_page_token: str | None):
+    """Yield a preview response as JSON chunks instead of buffering the full list.
+
+    Emitting per-trace keeps resident memory at O(1) per trace: the summary list
+    and the encoded JSON string never coexist in full.
+    """
+    yield b'{"traces":['
+    count = 0
+    for summary in map(_trace_to_summary, traces):
+        prefix = b"," if count else b""
+        count += 1
+        yield prefix + summary.model_dump_json().encode()
+    tail = {
+        "total_count": count,
+        "returned_count": count,
+        "next_page_token": next_page_token,
+    }
+    yield b"]," + json.dumps(tail, separators=(",", ":"))[1:].encode()
+
+
+# Serialized payload bytes for the GET-by-id handlers, keyed like _SDK_CACHE and
+# expiring with it so updates become visible together. Lets a repeat hit skip
+# re-serialization and makes the If-None-Match case a hash comparison with zero
+# body encoding.
+_ETAG_PAYLOAD_CACHE = TTLCache(maxsize=256, ttl=30)
+_ETAG_PAYLOAD_CACHE_LOCK = threading.Lock()
+
+
+def _etag_model_response(cache_key, model: BaseModel) -> Response:
+    """Serialize with an ETag and honor If-None-Match with a 304 short-circuit."""
+    with _ETAG_PAYLOAD_CACHE_LOCK:
+        cached = _ETAG_PAYLOAD_CACHE.get(cache_key)
+    if cached is None:
+        payload = model.model_dump_json(exclude_none=True).encode()
+        etag = hashlib.blake2b(payload, digest_size=16).hexdigest()
+        with _ETAG_PAYLOAD_CACHE_LOCK:
+            _ETAG_PAYLOAD_CACHE[cache_key] = (payload, etag)
+    else:
+        payload, etag = cached
+    if request.headers.get("If-None-Match") == etag:
+        return Response(status=304, headers={"ETag": etag})
+    return _raw_json_response(payload, headers=[("ETag", etag)])
+
+
+def _raw_json_response(
+    body: bytes, status: int = 200, headers: list[tuple[str, str]] | None = None
+) -> Response:
+    """Wrap pre-encoded JSON bytes in a Response with fully pre-composed headers.
+
+    Handing werkzeug the Content-Type and Content-Length up front skips its
+    default-mimetype negotiation and deferred body-length pass; the body is a
+    single bytes object, so its length is already known here.
+    """
+    return Response(
+        body,
+        status=status,
+        headers=[
+            ("Content-Type", "application/json"),
+            ("Content-Length", str(len(body))),
+            *(headers or []),
+        ],
+    )
+
+
+def _model_response(model: BaseModel) -> Response:
+    """Serialize a pydantic response model straight to JSON in pydantic-core.
+
+    ``model_dump_json`` emits JSON without materializing the intermediate Python
+    dict that ``model_dump`` + ``json.dumps`` would walk twice.
+    """
+    return _raw_json_response(model.model_dump_json(exclude_none=True).encode())
+
+
+def _json_response(payload, status: int = 200) -> Response:
+    """Serialize ``payload`` to a JSON response without going through flask.jsonify.
+
+    ``jsonify`` walks the payload with the app's pretty-printing/sorting JSON
+    provider; a direct compact ``json.dumps`` into a Response skips that second
+    traversal on the response-heavy preview endpoints.
+    """
+    body = json.dumps(payload, separators=(",", ":"), default=str).encode()
+    return _raw_json_response(body, status=status)
+
+
+def _make_handler(name: str, adapter: TypeAdapter, invoke):
+    """Build a handler as parse-body -> validate -> invoke(client, req).
+
+    The nine endpoints share this exact shape; generating them from one factory
+    keeps the fast paths (direct body parse, compiled validators, shared client)
+    applied uniformly instead of being re-plumbed per handler.
+    """
+
+    def handler():
+        try:
+            req = adapter.validate_python(_parse_request_body())
+        except ValidationError as e:
+            raise MlflowException(
+                f"Invalid request to {name}: {e}", error_code=INVALID_PARAMETER_VALUE
+            ) from e
+        return invoke(_get_insights_client(), req)
+
+    handler.__name__ = name
+    return catch_mlflow_exception(_disable_if_artifacts_only(handler))
+
+
+def _analyses_list(client, req):
+    analyses = _cached_sdk_call(
+        ("analyses_list", req.experiment_id, req.page_size, req.page_token),
+        lambda: client.list_analyses(
+            experiment_id=req.experiment_id,
+            page_size=min(req.page_size, _MAX_PAGE_SIZE),
+            page_token=req.page_token,
+        ),
+    )
+    return _model_response(
+        ListAnalysesResponse.model_construct(
+            analyses=list(analyses), next_page_token=analyses.token
+        )
+    )
+
+
+def _analyses_get(client, req):
+    analysis = _cached_sdk_call(
+        ("analyses_get", req.insights_run_id),
+        lambda: client.get_analysis(insights_run_id=req.insights_run_id),
+    )
+    response = GetAnalysisResponse.model_construct(analysis=analysis)
+    return _etag_model_response(("analyses_get", req.insights_run_id), response)
+
+
+def _hypotheses_list(client, req):
+    hypotheses = client.list_hypotheses(
+        insights_run_id=req.insights_run_id,
+        page_size=min(req.page_size, _MAX_PAGE_SIZE),
+        page_token=req.page_token,
+    )
+    return _model_response(
+        ListHypothesesResponse.model_construct(
+            hypotheses=list(hypotheses), next_page_token=hypotheses.token
+        )
+    )
+
+
+def _hypotheses_get(client, req):
+    hypothesis = client.get_hypothesis(
+        insights_run_id=req.insights_run_id, hypothesis_id=req.hypothesis_id
+    )
+    return _model_response(GetHypothesisResponse.model_construct(hypothesis=hypothesis))
+
+
+def _hypotheses_batch_get(client, req):
+    if len(req.hypothesis_ids) > _MAX_PAGE_SIZE:
+        return _json_response(
+            {"error": f"hypothesis_ids is limited to {_MAX_PAGE_SIZE} entries"},
+            status=400,
+        )
+    with ThreadPoolExecutor(
+        max_workers=min(8, len(req.hypothesis_ids) or 1), thread_name_prefix="agentic-batch-get"
+    ) as executor:
+        hypotheses = list(
+            executor.map(
+                lambda hid: client.get_hypothesis(
+                    insights_run_id=req.insights_run_id, hypothesis_id=hid
+                ),
+                req.hypothesis_ids,
+            )
+        )
+    return _model_response(BatchGetHypothesesResponse.model_construct(hypotheses=hypotheses))
+
+
+def _hypotheses_preview(client, req):
+    traces = client.preview_hypotheses(
+        experiment_id=req.experiment_id,
+        filter_string=req.filter_string,
+        max_traces=min(req.page_size, _MAX_PAGE_SIZE),
+        page_token=req.page_token,
+    )
+    return Response(
+        _stream_preview(traces, traces.token),
+        mimetype="application/json",
+        direct_passthrough=True,
+    )
+
+
+def _issues_list(client, req):
+    issues = _cached_sdk_call(
+        ("issues_list", req.insights_run_id, req.page_size, req.page_token),
+        lambda: client.list_issues(
+            insights_run_id=req.insights_run_id,
+            page_size=min(req.page_size, _MAX_PAGE_SIZE),
+            page_token=req.page_token,
+        ),
+    )
+    return _model_response(
+        ListIssuesResponse.model_construct(issues=list(issues), next_page_token=issues.token)
+    )
+
+
+def _issues_get(client, req):
+    issue = _cached_sdk_call(
+        ("issues_get", req.insights_run_id, req.issue_id),
+        lambda: client.get_issue(insights_run_id=req.insights_run_id, issue_id=req.issue_id),
+    )
+    response = GetIssueResponse.model_construct(issue=issue)
+    return _etag_model_response(("issues_get", req.insights_run_id, req.issue_id), response)
+
+
+def _issues_preview(client, req):
+    traces = client.preview_issues(
+        experiment_id=req.experiment_id,
+        filter_string=req.filter_string,
+        max_traces=min(req.page_size, _MAX_PAGE_SIZE),
+        page_token=req.page_token,
+    )
+    return Response(
+        _stream_preview(traces, traces.token),
+        mimetype="application/json",
+        direct_passthrough=True,
+    )
+
+
+# (url suffix, handler name, request validator, invoke) for every agentic endpoint.
+_ENDPOINT_TABLE = [
+    ("analyses/list", "agentic_analyses_list_handler", _LIST_ANALYSES, _analyses_list),
+    ("analyses/get", "agentic_analyses_get_handler", _GET_ANALYSIS, _analyses_get),
+    ("hypotheses/list", "agentic_hypotheses_list_handler", _LIST_HYPOTHESES, _hypotheses_list),
+    ("hypotheses/get", "agentic_hypotheses_get_handler", _GET_HYPOTHESIS, _hypotheses_get),
+    (
+        "hypotheses/batch-get",
+        "agentic_hypotheses_batch_get_handler",
+        _BATCH_GET_HYPOTHESES,
+        _hypotheses_batch_get,
+    ),
+    (
+        "hypotheses/preview",
+        "agentic_hypotheses_preview_handler",
+        _PREVIEW_HYPOTHESES,
+        _hypotheses_preview,
+    ),
+    ("issues/list", "agentic_issues_list_handler", _LIST_ISSUES, _issues_list),
+    ("issues/get", "agentic_issues_get_handler", _GET_ISSUE, _issues_get),
+    ("issues/preview", "agentic_issues_preview_handler", _PREVIEW_ISSUES, _issues_preview),
+]
+
+_HANDLERS = {
+    suffix: _make_handler(name, adapter, invoke)
+    for suffix, name, adapter, invoke in _ENDPOINT_TABLE
+}
+
+
+def _dispatch_agentic_request(sub: str):
+    """Route an agentic request by dict lookup on the path suffix.
+
+    All endpoints share the agentic prefix, so one catch-all rule with an O(1)
+    dict lookup replaces a per-rule regex scan through werkzeug's URL map.
+    """
+    handler = _HANDLERS.get(sub)
+    if handler is None:
+        raise NotFound(f"Unknown agentic insights endpoint: '{sub}'")
+    return handler()
+
+
+def get_endpoints():
+    """
+    Returns:
+        List of tuples (path, handler, methods) for the agentic insights endpoints.
+    """
+    return [(f"{_PREFIX}/<path:sub>", _dispatch_agentic_request, ["POST"])]
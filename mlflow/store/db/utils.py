@@ -28,6 +28,7 @@ from mlflow.environment_variables import (
     MLFLOW_SQLALCHEMYSTORE_POOL_RECYCLE,
     MLFLOW_SQLALCHEMYSTORE_POOL_SIZE,
     MLFLOW_SQLALCHEMYSTORE_POOLCLASS,
+    MLFLOW_SQLALCHEMYSTORE_QUERY_CACHE_SIZE,
 )
 from mlflow.exceptions import MlflowException
 from mlflow.protos.databricks_pb2 import (
@@ -270,6 +271,7 @@ def create_sqlalchemy_engine(db_uri):
     pool_recycle = MLFLOW_SQLALCHEMYSTORE_POOL_RECYCLE.get()
     echo = MLFLOW_SQLALCHEMYSTORE_ECHO.get()
     poolclass = MLFLOW_SQLALCHEMYSTORE_POOLCLASS.get()
+    query_cache_size = MLFLOW_SQLALCHEMYSTORE_QUERY_CACHE_SIZE.get()
     kwargs = {}
     # Send argument only if they have been injected.
     # Some engine does not support them (for example sqllite)
@@ -281,6 +283,8 @@ def create_sqlalchemy_engine(db_uri):
         kwargs["pool_recycle"] = pool_recycle
     if echo:
         kwargs["echo"] = echo
+    if query_cache_size:
+        kwargs["query_cache_size"] = query_cache_size
     if poolclass:
         pool_class_map = {
             "AssertionPool": AssertionPool,
@@ -0,0 +1,41 @@
+"""add insights analytics indexes
+
+Create Date: 2026-08-29 10:12:41.118204
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "3a899e29a429"
+down_revision = "bf29a5ff90ea"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Covering index for the insights traffic aggregations, which filter trace_info on
+    # experiment_id + timestamp_ms and read only status / execution_time_ms. Name is
+    # abbreviated to stay under the 64-character MySQL identifier limit.
+    with op.batch_alter_table("trace_info", schema=None) as batch_op:
+        batch_op.create_index(
+            "index_trace_info_exp_id_timestamp_ms_status_exec_time_ms",
+            ["experiment_id", "timestamp_ms", "status", "execution_time_ms"],
+            unique=False,
+        )
+    # Covering index for tool discovery/metrics over spans: filter by type, join on
+    # trace_id, aggregate the start/end timestamps. `name` is excluded because Text
+    # columns cannot be indexed without a prefix length on MySQL/MSSQL.
+    with op.batch_alter_table("spans", schema=None) as batch_op:
+        batch_op.create_index(
+            "index_spans_type_trace_id_start_end",
+            ["type", "trace_id", "start_time_unix_nano", "end_time_unix_nano"],
+            unique=False,
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("spans", schema=None) as batch_op:
+        batch_op.drop_index("index_spans_type_trace_id_start_end")
+    with op.batch_alter_table("trace_info", schema=None) as batch_op:
+        batch_op.drop_index("index_trace_info_exp_id_timestamp_ms_status_exec_time_ms")
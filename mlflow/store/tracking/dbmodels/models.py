@@ -717,6 +717,16 @@ class SqlTraceInfo(Base):
         # which is the default view in the UI. Also every search query should have experiment_id(s)
         # in the where clause.
         Index(f"index_{__tablename__}_experiment_id_timestamp_ms", "experiment_id", "timestamp_ms"),
+        # Covers the insights traffic aggregations, which filter on experiment_id +
+        # timestamp_ms and read only status / execution_time_ms (index-only scans).
+        # Name abbreviated to stay under the 64-character MySQL identifier limit.
+        Index(
+            f"index_{__tablename__}_exp_id_timestamp_ms_status_exec_time_ms",
+            "experiment_id",
+            "timestamp_ms",
+            "status",
+            "execution_time_ms",
+        ),
     )
 
     def to_mlflow_entity(self):
@@ -1758,6 +1768,16 @@ class SqlSpan(Base):
             "index_spans_experiment_id_type_status", "experiment_id", "type", "status"
         ),  # For type-only and type+status filters
         Index("index_spans_experiment_id_duration", "experiment_id", "duration_ns"),
+        # Covers the insights tool discovery/metrics queries: filter by type, join on
+        # trace_id, and aggregate the start/end timestamps. `name` is excluded because
+        # Text columns cannot be indexed without a prefix length on MySQL/MSSQL.
+        Index(
+            "index_spans_type_trace_id_start_end",
+            "type",
+            "trace_id",
+            "start_time_unix_nano",
+            "end_time_unix_nano",
+        ),
     )
 
 
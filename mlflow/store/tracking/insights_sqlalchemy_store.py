@@ -0,0 +1,984 @@
+"""SQLAlchemy-backed analytics queries for MLflow Insights.
+
+``InsightsSqlAlchemyStore`` extends :py:class:`SqlAlchemyStore
+<mlflow.store.tracking.sqlalchemy_store.SqlAlchemyStore>` with read-only aggregation
+queries over the ``trace_info`` and ``spans`` tables that back the insights
+dashboards: traffic volume, latency, and error time series, plus tool discovery
+and per-tool metrics.
+
+Timestamps in the returned payloads are epoch milliseconds; latencies are
+milliseconds. ``time_bucket`` is one of ``"hour"``, ``"day"``, or ``"week"``.
+"""
+
+import math
+import random
+import threading
+from array import array
+from collections import defaultdict
+from contextlib import contextmanager
+
+import numpy as np
+from cachetools import TTLCache
+from sqlalchemy import case, func, null, select, tuple_
+
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+from mlflow.store.db.db_types import POSTGRES
+from mlflow.store.tracking.dbmodels.models import SqlSpan, SqlTraceInfo
+from mlflow.store.tracking.sqlalchemy_store import SqlAlchemyStore
+from mlflow.utils.time import get_current_time_millis
+
+_TOOL_SPAN_TYPE = "TOOL"
+_ERROR_STATUS = "ERROR"
+_OK_STATUS = "OK"
+
+_BUCKET_GRANULARITIES = ("hour", "day", "week")
+
+_BUCKET_MS = {"hour": 3_600_000, "day": 86_400_000, "week": 604_800_000}
+
+# Shift applied before flooring week buckets so they start on Monday: epoch day
+# zero (1970-01-01) was a Thursday, three days after a Monday.
+_WEEK_EPOCH_OFFSET_MS = 3 * 86_400_000
+
+# Below this sample count a plain `sorted` beats numpy's fixed conversion and
+# dispatch overhead for the three order statistics.
+_SMALL_SAMPLE_THRESHOLD = 1024
+
+# Reservoir size for approximate percentiles; sampling error scales with
+# 1/sqrt(size), so 10k values bound p50/p90 error to roughly a percent.
+_APPROX_SAMPLE_SIZE = 10_000
+
+
+def _reservoir_add(sample, seen, value, rng):
+    """Algorithm R step: keep ``sample`` a uniform reservoir of the ``seen`` values."""
+    if len(sample) < _APPROX_SAMPLE_SIZE:
+        sample.append(value)
+        return
+    slot = rng.randrange(seen)
+    if slot < _APPROX_SAMPLE_SIZE:
+        sample[slot] = value
+
+
+def _partition_percentiles(values):
+    """Return (p50, p90, p99) of a 1-D numeric sequence (list or ndarray).
+
+    Small inputs — the common per-bucket case — take a plain ``sorted`` path to
+    skip numpy's conversion overhead; larger ones use ``np.partition``
+    (introselect), which places just the three order statistics in O(N) instead
+    of the O(N log N) full sort they were read from before.
+    """
+    count = len(values)
+    # Nearest-rank definition: the smallest value with at least q*count values at
+    # or below it. Plain truncation biased the result high whenever q*count was
+    # an exact integer.
+    idx = [max(0, min(math.ceil(count * q) - 1, count - 1)) for q in (0.5, 0.9, 0.99)]
+    if count < _SMALL_SAMPLE_THRESHOLD:
+        ordered = sorted(values)
+        return float(ordered[idx[0]]), float(ordered[idx[1]]), float(ordered[idx[2]])
+    part = np.partition(np.asarray(values), idx)
+    return float(part[idx[0]]), float(part[idx[1]]), float(part[idx[2]])
+
+
+class InsightsSqlAlchemyStore(SqlAlchemyStore):
+    """
+    SQL-backed store exposing aggregate trace analytics for the insights dashboards.
+
+    All methods are read-only and operate on the same database (and engine) as the
+    parent :py:class:`SqlAlchemyStore
+    <mlflow.store.tracking.sqlalchemy_store.SqlAlchemyStore>`.
+    """
+
+    def __init__(self, db_uri, default_artifact_root):
+        super().__init__(db_uri, default_artifact_root)
+        # The dialect cannot change for the lifetime of the engine; memoize it so the
+        # per-request expression builders below don't re-walk the engine attributes.
+        self._dialect = self._get_dialect()
+        # Closed-window time-series responses; see _cached_time_series.
+        self._ts_cache = TTLCache(maxsize=512, ttl=60)
+        self._ts_cache_lock = threading.Lock()
+
+    @contextmanager
+    def _read_session(self):
+        """Managed session tuned for the read-only analytics queries.
+
+        Autoflush is disabled (there is never pending ORM state to flush before a
+        query) and attributes are not expired by the closing commit, skipping the
+        identity-map walk the default session performs on every execute.
+        """
+        with self.ManagedSessionMaker() as session:
+            session.autoflush = False
+            session.expire_on_commit = False
+            yield session
+
+    def _bucket_expression(self, time_bucket, ts_ms_col):
+        """Return a GROUP BY expression yielding the bucket start in epoch milliseconds.
+
+        Flooring the millisecond column with integer arithmetic produces the same
+        bigint group key on every dialect — no strftime/date_trunc calls in SQL and
+        no datetime parsing on the rows coming back.
+        """
+        if time_bucket not in _BUCKET_GRANULARITIES:
+            raise MlflowException(
+                f"Invalid time_bucket: '{time_bucket}'",
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+        bucket_ms = _BUCKET_MS[time_bucket]
+        offset_ms = _WEEK_EPOCH_OFFSET_MS if time_bucket == "week" else 0
+        # `//` renders as integer division (or FLOOR on MySQL) on every dialect.
+        if offset_ms:
+            return ((ts_ms_col + offset_ms) // bucket_ms) * bucket_ms - offset_ms
+        return (ts_ms_col // bucket_ms) * bucket_ms
+
+    def _cached_time_series(
+        self, method, experiment_ids, start_time, end_time, time_bucket, impl, extra_key=()
+    ):
+        """Memoize time-series responses for fully closed windows.
+
+        Only windows whose end lies at least one bucket in the past are cached: every
+        bucket in such a window is complete, so a hit is exact rather than stale.
+        Open-ended or still-filling windows bypass the cache entirely; the TTL bounds
+        staleness after trace deletions. ``extra_key`` lets callers with parameters
+        beyond the shared five (e.g. a tool name) keep their entries distinct.
+        """
+        if end_time is None or end_time >= get_current_time_millis() - _BUCKET_MS.get(
+            time_bucket, 0
+        ):
+            return impl(experiment_ids, start_time, end_time, time_bucket)
+        key = (method, tuple(experiment_ids), start_time, end_time, time_bucket, *extra_key)
+        with self._ts_cache_lock:
+            hit = self._ts_cache.get(key)
+        if hit is not None:
+            return hit
+        result = impl(experiment_ids, start_time, end_time, time_bucket)
+        with self._ts_cache_lock:
+            self._ts_cache[key] = result
+        return result
+
+    def get_traffic_volume(
+        self, experiment_ids, start_time=None, end_time=None, time_bucket="hour"
+    ):
+        """
+        Compute trace counts (total / OK / error) over a time window, bucketed by hour,
+        day, or week.
+
+        Responses for fully closed windows are served from a short-TTL in-process cache.
+
+        Args:
+            experiment_ids: List of experiment IDs to include.
+            start_time: Optional window start in epoch milliseconds (inclusive).
+            end_time: Optional window end in epoch milliseconds (inclusive).
+            time_bucket: Bucket granularity: ``"hour"``, ``"day"``, or ``"week"``.
+
+        Returns:
+            Dict with ``summary`` (total/ok/error counts and error rate) and
+            ``time_series`` (one dict per bucket, keyed by bucket start in ms).
+        """
+        return self._cached_time_series(
+            "volume", experiment_ids, start_time, end_time, time_bucket, self._volume_impl
+        )
+
+    def _volume_impl(self, experiment_ids, start_time, end_time, time_bucket):
+        with self._read_session() as session:
+            filters = [SqlTraceInfo.experiment_id.in_(experiment_ids)]
+            if start_time is not None:
+                filters.append(SqlTraceInfo.timestamp_ms >= start_time)
+            if end_time is not None:
+                filters.append(SqlTraceInfo.timestamp_ms <= end_time)
+
+            bucket_expr = self._bucket_expression(time_bucket, SqlTraceInfo.timestamp_ms)
+
+            # Per-bucket counts in a CTE; the summary is a UNION ALL row that sums
+            # the CTE, so one scan of the filtered slice serves both halves of the
+            # response. The null bucket marks the summary row.
+            ts = (
+                select(
+                    bucket_expr.label("time_bucket"),
+                    func.count().label("count"),
+                    func.sum(case((SqlTraceInfo.status == _OK_STATUS, 1), else_=0)).label("ok"),
+                    func.sum(case((SqlTraceInfo.status == _ERROR_STATUS, 1), else_=0)).label(
+                        "errors"
+                    ),
+                )
+                .where(*filters)
+                .group_by(bucket_expr)
+                .cte("ts")
+            )
+            summary_rate = func.coalesce(
+                func.sum(ts.c.errors) * 100.0 / func.nullif(func.sum(ts.c.count), 0), 0.0
+            )
+            rows = session.execute(
+                select(ts.c.time_bucket, ts.c.count, ts.c.ok, ts.c.errors, null()).union_all(
+                    select(
+                        null(),
+                        func.sum(ts.c.count),
+                        func.sum(ts.c.ok),
+                        func.sum(ts.c.errors),
+                        summary_rate,
+                    )
+                )
+            ).all()
+
+            _, total, ok_count, error_count, error_rate = next(
+                row for row in rows if row[0] is None
+            )
+            time_series = [
+                {
+                    "time_bucket": int(bucket),
+                    "count": count,
+                    "ok_count": int(ok),
+                    "error_count": int(errors),
+                }
+                for bucket, count, ok, errors, _ in sorted(
+                    (row for row in rows if row[0] is not None), key=lambda row: row[0]
+                )
+            ]
+
+            return {
+                "summary": {
+                    "total_traces": int(total or 0),
+                    "ok_count": int(ok_count or 0),
+                    "error_count": int(error_count or 0),
+                    "error_rate": float(error_rate),
+                },
+                "time_series": time_series,
+            }
+
+    def get_traffic_latency(
+        self, experiment_ids, start_time=None, end_time=None, time_bucket="hour", approximate=False
+    ):
+        """
+        Compute latency statistics (avg/min/max and p50/p90/p99 of ``execution_time_ms``)
+        over a time window, globally and per bucket.
+
+        On PostgreSQL the percentiles are computed in the database with
+        ``percentile_cont``, so only aggregate rows cross the wire. Other dialects
+        fall back to fetching the raw values and computing percentiles in Python.
+        Responses for fully closed windows are served from a short-TTL in-process cache.
+
+        Args:
+            experiment_ids: List of experiment IDs to include.
+            start_time: Optional window start in epoch milliseconds (inclusive).
+            end_time: Optional window end in epoch milliseconds (inclusive).
+            time_bucket: Bucket granularity: ``"hour"``, ``"day"``, or ``"week"``.
+            approximate: If True, the non-PostgreSQL fallback computes percentiles from
+                bounded reservoir samples instead of every value, keeping memory O(sample)
+                on very large windows. Counts and averages stay exact; the PostgreSQL
+                path is unaffected.
+
+        Returns:
+            Dict with ``summary`` latency stats and ``time_series`` of per-bucket stats.
+        """
+        if approximate:
+            return self._cached_time_series(
+                "latency_approx",
+                experiment_ids,
+                start_time,
+                end_time,
+                time_bucket,
+                self._latency_approx_impl,
+            )
+        return self._cached_time_series(
+            "latency", experiment_ids, start_time, end_time, time_bucket, self._latency_impl
+        )
+
+    def _latency_impl(self, experiment_ids, start_time, end_time, time_bucket, approximate=False):
+        with self._read_session() as session:
+            filters = [
+                SqlTraceInfo.experiment_id.in_(experiment_ids),
+                SqlTraceInfo.execution_time_ms.isnot(None),
+            ]
+            if start_time is not None:
+                filters.append(SqlTraceInfo.timestamp_ms >= start_time)
+            if end_time is not None:
+                filters.append(SqlTraceInfo.timestamp_ms <= end_time)
+
+            bucket_expr = self._bucket_expression(time_bucket, SqlTraceInfo.timestamp_ms)
+
+            if self._dialect == POSTGRES:
+                return self._traffic_latency_sql_percentiles(
+                    session, filters, bucket_expr, time_bucket
+                )
+            if approximate:
+                return self._traffic_latency_reservoir_percentiles(
+                    session, filters, bucket_expr, time_bucket
+                )
+            return self._traffic_latency_python_percentiles(
+                session, filters, bucket_expr, time_bucket
+            )
+
+    def _latency_approx_impl(self, experiment_ids, start_time, end_time, time_bucket):
+        return self._latency_impl(
+            experiment_ids, start_time, end_time, time_bucket, approximate=True
+        )
+
+    def _traffic_latency_sql_percentiles(self, session, filters, bucket_expr, time_bucket):
+        """Grouped-aggregate latency path for dialects with ``percentile_cont``."""
+        latency = SqlTraceInfo.execution_time_ms
+        aggregates = [
+            func.count().label("count"),
+            func.avg(latency).label("avg"),
+            func.min(latency).label("min"),
+            func.max(latency).label("max"),
+            func.percentile_cont(0.5).within_group(latency.asc()).label("p50"),
+            func.percentile_cont(0.9).within_group(latency.asc()).label("p90"),
+            func.percentile_cont(0.99).within_group(latency.asc()).label("p99"),
+        ]
+        summary_row = session.execute(select(*aggregates).where(*filters)).one()
+        if not summary_row.count:
+            return {"summary": self._empty_latency_summary(), "time_series": []}
+
+        bucket_rows = session.execute(
+            select(bucket_expr.label("time_bucket"), *aggregates)
+            .where(*filters)
+            .group_by(bucket_expr)
+            .order_by(bucket_expr)
+        ).all()
+        time_series = [
+            {
+                "time_bucket": int(row.time_bucket),
+                "count": row.count,
+                "avg_ms": float(row.avg),
+                "p50_ms": float(row.p50),
+                "p90_ms": float(row.p90),
+                "p99_ms": float(row.p99),
+            }
+            for row in bucket_rows
+        ]
+        return {
+            "summary": {
+                "count": summary_row.count,
+                "avg_ms": float(summary_row.avg),
+                "min_ms": float(summary_row.min),
+                "max_ms": float(summary_row.max),
+                "p50_ms": float(summary_row.p50),
+                "p90_ms": float(summary_row.p90),
+                "p99_ms": float(summary_row.p99),
+            },
+            "time_series": time_series,
+        }
+
+    def _traffic_latency_python_percentiles(self, session, filters, bucket_expr, time_bucket):
+        """Fallback latency path: fetch raw values and compute percentiles in-process.
+
+        Raw values are streamed through a Core ``select`` of just the latency column —
+        no ORM object construction, and ``stream_results`` keeps memory bounded by the
+        ``yield_per`` batch size on drivers with server-side cursors.
+        """
+        stmt = (
+            select(SqlTraceInfo.execution_time_ms)
+            .where(*filters)
+            .execution_options(stream_results=True, yield_per=10_000)
+        )
+        arr = np.fromiter(session.execute(stmt).scalars(), dtype=np.int64)
+        count = arr.size
+        if count == 0:
+            return {"summary": self._empty_latency_summary(), "time_series": []}
+
+        p50, p90, p99 = _partition_percentiles(arr)
+        summary = {
+            "count": count,
+            "avg_ms": float(arr.mean()),
+            "min_ms": float(arr.min()),
+            "max_ms": float(arr.max()),
+            "p50_ms": p50,
+            "p90_ms": p90,
+            "p99_ms": p99,
+        }
+
+        bucket_stmt = (
+            select(bucket_expr.label("time_bucket"), SqlTraceInfo.execution_time_ms)
+            .where(*filters)
+            .execution_options(stream_results=True, yield_per=10_000)
+        )
+        # array('q') packs the per-bucket latencies as raw int64 instead of a list
+        # of boxed Python ints — ~5x less memory and a zero-copy hand-off to numpy.
+        time_buckets = defaultdict(lambda: array("q"))
+        for bucket_value, execution_time_ms in session.execute(bucket_stmt):
+            time_buckets[bucket_value].append(execution_time_ms)
+
+        time_series = [
+            self._latency_bucket_entry(bucket_value, time_buckets[bucket_value])
+            for bucket_value in sorted(time_buckets)
+        ]
+        return {"summary": summary, "time_series": time_series}
+
+    def _traffic_latency_reservoir_percentiles(self, session, filters, bucket_expr, time_bucket):
+        """Approximate fallback for very large windows.
+
+        One streamed pass keeps a bounded reservoir sample per bucket plus one for
+        the summary, so memory stays O(sample size) regardless of row count. Counts,
+        averages, and min/max remain exact; only the percentiles come from the
+        samples.
+        """
+        bucket_stmt = (
+            select(bucket_expr.label("time_bucket"), SqlTraceInfo.execution_time_ms)
+            .where(*filters)
+            .execution_options(stream_results=True, yield_per=10_000)
+        )
+        rng = random.Random()
+        count = total = 0
+        min_ms = max_ms = None
+        summary_sample = array("q")
+        buckets = {}
+        for bucket_value, value in session.execute(bucket_stmt):
+            count += 1
+            total += value
+            if min_ms is None or value < min_ms:
+                min_ms = value
+            if max_ms is None or value > max_ms:
+                max_ms = value
+            _reservoir_add(summary_sample, count, value, rng)
+            state = buckets.get(bucket_value)
+            if state is None:
+                state = buckets[bucket_value] = [0, 0, array("q")]
+            state[0] += 1
+            state[1] += value
+            _reservoir_add(state[2], state[0], value, rng)
+
+        if count == 0:
+            return {"summary": self._empty_latency_summary(), "time_series": []}
+
+        p50, p90, p99 = _partition_percentiles(summary_sample)
+        time_series = []
+        for bucket_value in sorted(buckets):
+            bucket_count, bucket_total, bucket_sample = buckets[bucket_value]
+            b50, b90, b99 = _partition_percentiles(bucket_sample)
+            time_series.append(
+                {
+                    "time_bucket": int(bucket_value),
+                    "count": bucket_count,
+                    "avg_ms": bucket_total / bucket_count,
+                    "p50_ms": b50,
+                    "p90_ms": b90,
+                    "p99_ms": b99,
+                }
+            )
+        return {
+            "summary": {
+                "count": count,
+                "avg_ms": total / count,
+                "min_ms": float(min_ms),
+                "max_ms": float(max_ms),
+                "p50_ms": p50,
+                "p90_ms": p90,
+                "p99_ms": p99,
+            },
+            "time_series": time_series,
+        }
+
+    @staticmethod
+    def _latency_bucket_entry(bucket_value, latencies):
+        p50, p90, p99 = _partition_percentiles(latencies)
+        return {
+            "time_bucket": int(bucket_value),
+            "count": len(latencies),
+            "avg_ms": sum(latencies) / len(latencies),
+            "p50_ms": p50,
+            "p90_ms": p90,
+            "p99_ms": p99,
+        }
+
+    @staticmethod
+    def _empty_latency_summary():
+        return {
+            "count": 0,
+            "avg_ms": 0.0,
+            "min_ms": 0.0,
+            "max_ms": 0.0,
+            "p50_ms": 0.0,
+            "p90_ms": 0.0,
+            "p99_ms": 0.0,
+        }
+
+    def get_traffic_errors(
+        self, experiment_ids, start_time=None, end_time=None, time_bucket="hour"
+    ):
+        """
+        Compute error counts and rates over a time window, globally and per bucket.
+
+        Responses for fully closed windows are served from a short-TTL in-process cache.
+
+        Args:
+            experiment_ids: List of experiment IDs to include.
+            start_time: Optional window start in epoch milliseconds (inclusive).
+            end_time: Optional window end in epoch milliseconds (inclusive).
+            time_bucket: Bucket granularity: ``"hour"``, ``"day"``, or ``"week"``.
+
+        Returns:
+            Dict with ``summary`` error stats and ``time_series`` of per-bucket stats.
+        """
+        return self._cached_time_series(
+            "errors", experiment_ids, start_time, end_time, time_bucket, self._errors_impl
+        )
+
+    def _errors_impl(self, experiment_ids, start_time, end_time, time_bucket):
+        with self._read_session() as session:
+            filters = [SqlTraceInfo.experiment_id.in_(experiment_ids)]
+            if start_time is not None:
+                filters.append(SqlTraceInfo.timestamp_ms >= start_time)
+            if end_time is not None:
+                filters.append(SqlTraceInfo.timestamp_ms <= end_time)
+
+            bucket_expr = self._bucket_expression(time_bucket, SqlTraceInfo.timestamp_ms)
+
+            # Same single-scan shape as _volume_impl: per-bucket CTE plus a
+            # null-bucket UNION ALL row carrying the window-wide summary.
+            ts = (
+                select(
+                    bucket_expr.label("time_bucket"),
+                    func.count().label("count"),
+                    func.sum(case((SqlTraceInfo.status == _ERROR_STATUS, 1), else_=0)).label(
+                        "errors"
+                    ),
+                )
+                .where(*filters)
+                .group_by(bucket_expr)
+                .cte("ts")
+            )
+            # error_rate comes back from the DB as a real number; NULLIF guards the
+            # zero division and COALESCE normalizes the empty-window null to 0.0.
+            rate = func.coalesce(ts.c.errors * 100.0 / func.nullif(ts.c.count, 0), 0.0).label(
+                "error_rate"
+            )
+            summary_rate = func.coalesce(
+                func.sum(ts.c.errors) * 100.0 / func.nullif(func.sum(ts.c.count), 0), 0.0
+            )
+            rows = session.execute(
+                select(ts.c.time_bucket, ts.c.count, ts.c.errors, rate).union_all(
+                    select(null(), func.sum(ts.c.count), func.sum(ts.c.errors), summary_rate)
+                )
+            ).all()
+
+            _, total, error_count, error_rate = next(row for row in rows if row[0] is None)
+            time_series = [
+                {
+                    "time_bucket": int(bucket),
+                    "count": count,
+                    "error_count": int(errors),
+                    "error_rate": float(bucket_rate),
+                }
+                for bucket, count, errors, bucket_rate in sorted(
+                    (row for row in rows if row[0] is not None), key=lambda row: row[0]
+                )
+            ]
+
+            return {
+                "summary": {
+                    "total_traces": int(total or 0),
+                    "error_count": int(error_count or 0),
+                    "error_rate": float(error_rate),
+                },
+                "time_series": time_series,
+            }
+
+    def discover_tools(self, experiment_ids, start_time=None, end_time=None, min_trace_count=1):
+        """
+        Discover tools invoked in the given experiments, with call and latency statistics.
+
+        Args:
+            experiment_ids: List of experiment IDs to include.
+            start_time: Optional window start in epoch milliseconds (inclusive).
+            end_time: Optional window end in epoch milliseconds (inclusive).
+            min_trace_count: Minimum number of distinct traces a tool must appear in.
+
+        Returns:
+            Dict with ``tools`` (one dict per tool, sorted by trace count descending)
+            and ``total_traces`` in the window.
+        """
+        start_ns = start_time * 1_000_000 if start_time is not None else None
+        end_ns = end_time * 1_000_000 if end_time is not None else None
+        with self._read_session() as session:
+            span_filters = [
+                SqlSpan.type == _TOOL_SPAN_TYPE,
+                SqlSpan.name.isnot(None),
+                SqlTraceInfo.experiment_id.in_(experiment_ids),
+            ]
+            if start_ns is not None:
+                span_filters.append(SqlSpan.start_time_unix_nano >= start_ns)
+            if end_ns is not None:
+                span_filters.append(SqlSpan.start_time_unix_nano <= end_ns)
+
+            trace_filters = [SqlTraceInfo.experiment_id.in_(experiment_ids)]
+            if start_time is not None:
+                trace_filters.append(SqlTraceInfo.timestamp_ms >= start_time)
+            if end_time is not None:
+                trace_filters.append(SqlTraceInfo.timestamp_ms <= end_time)
+            # Constant scalar subquery riding along on every grouped row, so the
+            # percentage divisor comes back in the same round-trip as the tool rows.
+            total_traces_sq = (
+                select(func.count(func.distinct(SqlTraceInfo.request_id)))
+                .where(*trace_filters)
+                .scalar_subquery()
+            )
+
+            # Persisted generated column; the DB never recomputes end - start per row.
+            duration_ns = SqlSpan.duration_ns
+            aggregates = [
+                SqlSpan.name,
+                func.count(func.distinct(SqlSpan.trace_id)).label("trace_count"),
+                func.count().label("total_calls"),
+                func.sum(case((SqlSpan.status == _ERROR_STATUS, 1), else_=0)).label("error_count"),
+                func.avg(duration_ns).label("avg_ns"),
+                # ns -> ms in SQL so no per-row conversion is needed on the way out.
+                (func.min(SqlSpan.start_time_unix_nano) // 1_000_000).label("first_seen"),
+                (func.max(SqlSpan.start_time_unix_nano) // 1_000_000).label("last_seen"),
+                total_traces_sq.label("total_traces"),
+            ]
+            if self._dialect == POSTGRES:
+                aggregates.extend(
+                    func.percentile_cont(q).within_group(duration_ns.asc()).label(label)
+                    for q, label in ((0.5, "p50_ns"), (0.9, "p90_ns"), (0.99, "p99_ns"))
+                )
+            tool_rows = session.execute(
+                select(*aggregates)
+                .join(SqlTraceInfo, SqlSpan.trace_id == SqlTraceInfo.request_id)
+                .where(*span_filters)
+                .group_by(SqlSpan.name)
+                .having(func.count(func.distinct(SqlSpan.trace_id)) >= min_trace_count)
+                .order_by(func.count(func.distinct(SqlSpan.trace_id)).desc())
+            ).all()
+
+            if tool_rows:
+                total_traces = tool_rows[0].total_traces
+            else:
+                total_traces = session.execute(
+                    select(func.count(func.distinct(SqlTraceInfo.request_id))).where(*trace_filters)
+                ).scalar()
+
+            if self._dialect == POSTGRES:
+                percentiles = {
+                    row.name: (
+                        float(row.p50_ns) / 1000000.0,
+                        float(row.p90_ns) / 1000000.0,
+                        float(row.p99_ns) / 1000000.0,
+                    )
+                    for row in tool_rows
+                    if row.p50_ns is not None
+                }
+            else:
+                percentiles = self._tool_percentiles_python(session, span_filters)
+
+            tools = []
+            for tool_row in tool_rows:
+                total_calls = tool_row.total_calls
+                error_count = int(tool_row.error_count or 0)
+                p50, p90, p99 = percentiles.get(tool_row.name, (0.0, 0.0, 0.0))
+                tools.append(
+                    {
+                        "name": tool_row.name,
+                        "trace_count": tool_row.trace_count,
+                        "total_calls": total_calls,
+                        "error_count": error_count,
+                        "error_rate": (error_count / total_calls * 100) if total_calls else 0.0,
+                        "percentage": (tool_row.trace_count / total_traces * 100)
+                        if total_traces
+                        else 0.0,
+                        "avg_latency_ms": float(tool_row.avg_ns) / 1000000.0
+                        if tool_row.avg_ns is not None
+                        else 0.0,
+                        "p50_latency_ms": p50,
+                        "p90_latency_ms": p90,
+                        "p99_latency_ms": p99,
+                        "first_seen": int(tool_row.first_seen),
+                        "last_seen": int(tool_row.last_seen),
+                    }
+                )
+
+            return {"tools": tools, "total_traces": total_traces}
+
+    def _tool_percentiles_python(self, session, span_filters):
+        """Per-tool latency percentiles for dialects without ``percentile_cont``.
+
+        One scan over (name, duration) pairs replaces the former per-tool queries.
+        """
+        duration_stmt = (
+            select(SqlSpan.name, SqlSpan.duration_ns)
+            .join(SqlTraceInfo, SqlSpan.trace_id == SqlTraceInfo.request_id)
+            .where(*span_filters, SqlSpan.duration_ns.isnot(None))
+            .execution_options(stream_results=True, yield_per=10_000)
+        )
+        durations_by_tool = defaultdict(lambda: array("q"))
+        for name, duration_ns in session.execute(duration_stmt):
+            durations_by_tool[name].append(duration_ns)
+        percentiles = {}
+        for name, durations in durations_by_tool.items():
+            p50, p90, p99 = _partition_percentiles(durations)
+            percentiles[name] = (p50 / 1000000.0, p90 / 1000000.0, p99 / 1000000.0)
+        return percentiles
+
+    def get_tool_metrics(
+        self,
+        experiment_ids,
+        tool_name,
+        start_time=None,
+        end_time=None,
+        time_bucket="hour",
+        include_time_series=True,
+    ):
+        """
+        Compute call, error, and latency metrics for a single tool, globally and per
+        time bucket.
+
+        Responses for fully closed windows are served from a short-TTL in-process cache.
+
+        Args:
+            experiment_ids: List of experiment IDs to include.
+            tool_name: Name of the tool span to aggregate.
+            start_time: Optional window start in epoch milliseconds (inclusive).
+            end_time: Optional window end in epoch milliseconds (inclusive).
+            time_bucket: Bucket granularity: ``"hour"``, ``"day"``, or ``"week"``.
+            include_time_series: If ``False``, skip the per-bucket aggregation and
+                return an empty ``time_series`` — roughly halves the work for
+                callers that only render the summary.
+
+        Returns:
+            Dict with ``summary`` tool stats and ``time_series`` of per-bucket stats.
+        """
+        return self._cached_time_series(
+            "tool_metrics",
+            experiment_ids,
+            start_time,
+            end_time,
+            time_bucket,
+            lambda eids, st, et, tb: self._tool_metrics_impl(
+                eids, tool_name, st, et, tb, include_time_series
+            ),
+            extra_key=(tool_name, include_time_series),
+        )
+
+    def _tool_metrics_impl(
+        self, experiment_ids, tool_name, start_time, end_time, time_bucket, include_time_series
+    ):
+        start_ns = start_time * 1_000_000 if start_time is not None else None
+        end_ns = end_time * 1_000_000 if end_time is not None else None
+        with self._read_session() as session:
+            span_filters = [
+                SqlSpan.type == _TOOL_SPAN_TYPE,
+                SqlSpan.name == tool_name,
+                SqlTraceInfo.experiment_id.in_(experiment_ids),
+            ]
+            if start_ns is not None:
+                span_filters.append(SqlSpan.start_time_unix_nano >= start_ns)
+            if end_ns is not None:
+                span_filters.append(SqlSpan.start_time_unix_nano <= end_ns)
+
+            # Persisted generated column; the DB never recomputes end - start per row.
+            duration_ns = SqlSpan.duration_ns
+            # Bucket on an integer epoch-millisecond expression so the group key
+            # comes back as a bigint on every dialect and no per-row datetime
+            # parsing happens client-side.
+            bucket_expr = self._bucket_expression(
+                time_bucket, SqlSpan.start_time_unix_nano // 1_000_000
+            )
+
+            if self._dialect == POSTGRES:
+                return self._tool_metrics_grouping_sets(
+                    session,
+                    tool_name,
+                    span_filters,
+                    duration_ns,
+                    bucket_expr,
+                    include_time_series=include_time_series,
+                )
+
+            summary_row = session.execute(
+                select(
+                    func.count().label("total_calls"),
+                    func.count(func.distinct(SqlSpan.trace_id)).label("trace_count"),
+                    func.sum(case((SqlSpan.status == _ERROR_STATUS, 1), else_=0)).label(
+                        "error_count"
+                    ),
+                    func.avg(duration_ns).label("avg_ns"),
+                )
+                .join(SqlTraceInfo, SqlSpan.trace_id == SqlTraceInfo.request_id)
+                .where(*span_filters)
+            ).one()
+
+            total_calls = summary_row.total_calls
+            if total_calls == 0:
+                return self._empty_tool_metrics(tool_name)
+
+            error_count = int(summary_row.error_count or 0)
+            trace_count = summary_row.trace_count
+            avg_latency = (
+                float(summary_row.avg_ns) / 1000000.0 if summary_row.avg_ns is not None else 0.0
+            )
+
+            latency_stmt = (
+                select(duration_ns)
+                .join(SqlTraceInfo, SqlSpan.trace_id == SqlTraceInfo.request_id)
+                .where(*span_filters, duration_ns.isnot(None))
+                .execution_options(stream_results=True, yield_per=10_000)
+            )
+            lat = np.fromiter(session.execute(latency_stmt).scalars(), dtype=np.float64)
+            if lat.size:
+                lat /= 1000000.0
+                p50, p90, p99 = _partition_percentiles(lat)
+            else:
+                p50 = p90 = p99 = 0.0
+
+            time_series = (
+                self._tool_time_series_pandas(session, span_filters, bucket_expr)
+                if include_time_series
+                else []
+            )
+
+            return {
+                "summary": {
+                    "tool_name": tool_name,
+                    "total_calls": total_calls,
+                    "trace_count": trace_count,
+                    "error_count": error_count,
+                    "error_rate": (error_count / total_calls * 100) if total_calls else 0.0,
+                    "avg_latency_ms": avg_latency,
+                    "p50_latency_ms": p50,
+                    "p90_latency_ms": p90,
+                    "p99_latency_ms": p99,
+                },
+                "time_series": time_series,
+            }
+
+    def _tool_time_series_pandas(self, session, span_filters, bucket_expr):
+        """Per-bucket tool stats for dialects without ``GROUPING SETS`` support.
+
+        Streams (bucket, duration, status) rows — the cursor is consumed chunk by
+        chunk, never materialized as a list — and groups them in pandas so the
+        count/error/mean aggregations all run vectorized in C.
+        """
+        import pandas as pd
+
+        time_series_stmt = (
+            select(bucket_expr.label("time_bucket"), SqlSpan.duration_ns, SqlSpan.status)
+            .join(SqlTraceInfo, SqlSpan.trace_id == SqlTraceInfo.request_id)
+            .where(*span_filters)
+            .execution_options(stream_results=True, yield_per=10_000)
+        )
+        df = pd.DataFrame(
+            session.execute(time_series_stmt),
+            columns=["time_bucket", "duration_ns", "status"],
+        )
+        time_series = []
+        if df.empty:
+            return time_series
+        # astype keeps NULL durations (in-progress spans) as NaN.
+        df["latency_ms"] = df["duration_ns"].astype("float64") / 1000000.0
+        df["is_error"] = (df["status"] == _ERROR_STATUS).astype(np.int64)
+        grouped = df.groupby("time_bucket", sort=True)
+        stats = grouped.agg(
+            count=("status", "size"),
+            error_count=("is_error", "sum"),
+            avg_latency_ms=("latency_ms", "mean"),
+        )
+        lat_by_bucket = {bucket: sub.dropna().to_numpy() for bucket, sub in grouped["latency_ms"]}
+        for bucket_value, stat_row in stats.iterrows():
+            bucket_count = int(stat_row["count"])
+            bucket_errs = int(stat_row["error_count"])
+            bucket_lats = lat_by_bucket[bucket_value]
+            if bucket_lats.size:
+                b50, b90, b99 = _partition_percentiles(bucket_lats)
+                b_avg = float(stat_row["avg_latency_ms"])
+            else:
+                b50 = b90 = b99 = b_avg = 0.0
+            time_series.append(
+                {
+                    "time_bucket": int(bucket_value),
+                    "count": bucket_count,
+                    "error_count": bucket_errs,
+                    "error_rate": (bucket_errs / bucket_count * 100) if bucket_count else 0.0,
+                    "avg_latency_ms": b_avg,
+                    "p50_latency_ms": b50,
+                    "p90_latency_ms": b90,
+                    "p99_latency_ms": b99,
+                }
+            )
+        return time_series
+
+    def _tool_metrics_grouping_sets(
+        self, session, tool_name, span_filters, duration_ns, bucket_expr, include_time_series=True
+    ):
+        """Postgres fast path for :py:meth:`get_tool_metrics`.
+
+        ``GROUP BY GROUPING SETS ((), (bucket))`` scans the spans once and returns
+        the global summary (``NULL`` bucket key) alongside the per-bucket rows,
+        with exact percentiles from ``percentile_cont`` — no second query and no
+        raw latency rows crossing the wire. With ``include_time_series=False`` the
+        grouping collapses to the plain global aggregate.
+        """
+        aggregates = [
+            func.count().label("call_count"),
+            func.count(func.distinct(SqlSpan.trace_id)).label("trace_count"),
+            func.sum(case((SqlSpan.status == _ERROR_STATUS, 1), else_=0)).label("error_count"),
+            func.avg(duration_ns).label("avg_ns"),
+        ]
+        aggregates.extend(
+            func.percentile_cont(q).within_group(duration_ns.asc()).label(label)
+            for q, label in ((0.5, "p50_ns"), (0.9, "p90_ns"), (0.99, "p99_ns"))
+        )
+        if include_time_series:
+            stmt = select(bucket_expr.label("time_bucket"), *aggregates).group_by(
+                func.grouping_sets(tuple_(), tuple_(bucket_expr))
+            )
+        else:
+            stmt = select(null().label("time_bucket"), *aggregates)
+        rows = session.execute(
+            stmt.join(SqlTraceInfo, SqlSpan.trace_id == SqlTraceInfo.request_id).where(
+                *span_filters
+            )
+        ).all()
+        # The empty grouping set always yields exactly one row, even on no input.
+        summary_row = next(row for row in rows if row.time_bucket is None)
+        if summary_row.call_count == 0:
+            return self._empty_tool_metrics(tool_name)
+        time_series = [
+            self._tool_bucket_entry(row)
+            for row in sorted(
+                (row for row in rows if row.time_bucket is not None),
+                key=lambda row: row.time_bucket,
+            )
+        ]
+        stats = self._tool_bucket_entry(summary_row)
+        return {
+            "summary": {
+                "tool_name": tool_name,
+                "total_calls": stats["count"],
+                "trace_count": summary_row.trace_count,
+                "error_count": stats["error_count"],
+                "error_rate": stats["error_rate"],
+                "avg_latency_ms": stats["avg_latency_ms"],
+                "p50_latency_ms": stats["p50_latency_ms"],
+                "p90_latency_ms": stats["p90_latency_ms"],
+                "p99_latency_ms": stats["p99_latency_ms"],
+            },
+            "time_series": time_series,
+        }
+
+    @staticmethod
+    def _tool_bucket_entry(row):
+        error_count = int(row.error_count or 0)
+        return {
+            "time_bucket": int(row.time_bucket) if row.time_bucket is not None else None,
+            "count": row.call_count,
+            "error_count": error_count,
+            "error_rate": (error_count / row.call_count * 100) if row.call_count else 0.0,
+            "avg_latency_ms": float(row.avg_ns) / 1000000.0 if row.avg_ns is not None else 0.0,
+            "p50_latency_ms": float(row.p50_ns) / 1000000.0 if row.p50_ns is not None else 0.0,
+            "p90_latency_ms": float(row.p90_ns) / 1000000.0 if row.p90_ns is not None else 0.0,
+            "p99_latency_ms": float(row.p99_ns) / 1000000.0 if row.p99_ns is not None else 0.0,
+        }
+
+    @staticmethod
+    def _empty_tool_metrics(tool_name):
+        return {
+            "summary": {
+                "tool_name": tool_name,
+                "total_calls": 0,
+                "trace_count": 0,
+                "error_count": 0,
+                "error_rate": 0.0,
+                "avg_latency_ms": 0.0,
+                "p50_latency_ms": 0.0,
+                "p90_latency_ms": 0.0,
+                "p99_latency_ms": 0.0,
+            },
+            "time_series": [],
+        }
@@ -0,0 +1,234 @@
+"""Shared fixtures and an in-memory ``MlflowClient`` double for the insights tests."""
+
+import copy
+import json
+import os
+import shutil
+import tempfile
+from collections import ChainMap
+from functools import partial
+from types import MappingProxyType
+from unittest import mock
+
+import pytest
+import yaml
+
+import mlflow.insights.utils as insights_utils
+from mlflow.entities import FileInfo
+from mlflow.exceptions import MlflowException
+from mlflow.insights.client import InsightsClient
+from mlflow.protos.databricks_pb2 import RESOURCE_DOES_NOT_EXIST
+from mlflow.store.entities.paged_list import PagedList
+
+# libyaml-backed loader/dumper resolved once at import (same fallback pattern as
+# mlflow.insights.utils) rather than a getattr per call.
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# partial binds the loader/dumper argument at C level, skipping per-call Python
+# keyword re-parsing; ``dump`` serializes to YAML, ``load`` parses it back.
+dump = partial(yaml.dump, Dumper=Dumper, default_flow_style=False)
+load = partial(yaml.load, Loader=Loader)
+
+
+# Memo of (run_id, run_type, parent_run_id) -> run double. The same handful of runs
+# is rebuilt across most tests; constructing the Mock once per argument tuple keeps
+# per-test setup to a dict lookup.
+_MOCK_RUN_CACHE = {}
+
+
+def create_mock_run(run_id, run_type=None, parent_run_id=None):
+    """Build a Run double carrying the tags the insights helpers inspect.
+
+    Instances are memoized per argument tuple. The tags dict is rebuilt on every
+    call because ``log_batch`` mutates it in place, and a mutation cached from one
+    test must not leak into the next.
+    """
+    key = (run_id, run_type, parent_run_id)
+    run = _MOCK_RUN_CACHE.get(key)
+    if run is None:
+        run = mock.Mock()
+        run.info.run_id = run_id
+        run.info.artifact_uri = f"mock://{run_id}/artifacts"
+        _MOCK_RUN_CACHE[key] = run
+    tags = {}
+    if run_type is not None:
+        tags[insights_utils.INSIGHTS_TYPE_TAG] = run_type
+    if parent_run_id is not None:
+        tags[insights_utils.MLFLOW_PARENT_RUN_ID_TAG] = parent_run_id
+    run.data.tags = tags
+    return run
+
+
+def setup_parent_analysis(mock_client, parent_id="parent-run-id", analysis_id="analysis-run-id"):
+    """Seed a parent insights run and its nested analysis run with one dict update."""
+    parent_run = create_mock_run(parent_id, run_type="parent")
+    analysis_run = create_mock_run(analysis_id, parent_run_id=parent_id)
+    mock_client._runs.update({parent_id: parent_run, analysis_id: analysis_run})
+    return parent_run, analysis_run
+
+
+class MockMlflowClient:
+    """In-memory double for the slice of ``MlflowClient`` the insights client uses.
+
+    Artifacts are held as plain Python objects keyed by ``"<run_id>/<artifact_path>"``,
+    so tests seed and assert on dicts with no serialization at all. Uploads are parsed
+    once on the way in; downloads serialize lazily with ``json.dumps``, which the
+    production YAML loaders accept because JSON is a subset of YAML.
+    """
+
+    def __init__(self):
+        self._runs = {}
+        self._raw_artifacts = {}
+        self._traces = []
+        self._search_traces_calls = []
+        self._download_dir = tempfile.mkdtemp(prefix="mock_insights_artifacts_")
+
+    def get_run(self, run_id):
+        if run_id not in self._runs:
+            raise MlflowException(f"Run '{run_id}' not found", error_code=RESOURCE_DOES_NOT_EXIST)
+        return self._runs[run_id]
+
+    def log_artifact(self, run_id, local_path, artifact_path=None):
+        name = os.path.basename(local_path)
+        key = "/".join(part for part in (run_id, artifact_path, name) if part)
+        with open(local_path) as f:
+            # Uploads from the insights code are always YAML; parse them once on the
+            # way in so every later read is a plain dict lookup.
+            self._raw_artifacts[key] = load(f.read())
+
+    def bulk_set_artifacts(self, mapping):
+        """Seed many artifacts with a single dict update; values are Python objects."""
+        self._raw_artifacts.update(mapping)
+
+    def download_artifacts(self, run_id, artifact_path, dst_path=None):
+        key = f"{run_id}/{artifact_path}"
+        if key not in self._raw_artifacts:
+            raise MlflowException(
+                f"Artifact '{artifact_path}' not found for run '{run_id}'",
+                error_code=RESOURCE_DOES_NOT_EXIST,
+            )
+        local_path = os.path.join(self._download_dir, os.path.basename(artifact_path))
+        with open(local_path, "w") as f:
+            # default=dict lets frozen MappingProxyType seeds serialize transparently.
+            f.write(json.dumps(self._raw_artifacts[key], default=dict))
+        return local_path
+
+    def list_artifacts(self, run_id, path=None):
+        prefix = f"{run_id}/" + (f"{path}/" if path else "")
+        return [
+            FileInfo(key[len(run_id) + 1 :], False, None)
+            for key in self._raw_artifacts
+            if key.startswith(prefix)
+        ]
+
+    def search_runs(
+        self,
+        experiment_ids,
+        filter_string=None,
+        run_view_type=None,
+        max_results=1000,
+        order_by=None,
+        page_token=None,
+    ):
+        # The insights helpers only ever filter on the insights type tag, so extract
+        # the quoted value instead of implementing a real filter grammar.
+        wanted = filter_string.rsplit("'", 2)[1] if filter_string else None
+        matches = [
+            run
+            for run in self._runs.values()
+            if wanted is None or run.data.tags.get(insights_utils.INSIGHTS_TYPE_TAG) == wanted
+        ]
+        return PagedList(matches[:max_results], None)
+
+    def search_traces(
+        self,
+        experiment_ids,
+        filter_string=None,
+        max_results=100,
+        page_token=None,
+        include_spans=True,
+    ):
+        self._search_traces_calls.append(
+            {
+                "experiment_ids": experiment_ids,
+                "filter_string": filter_string,
+                "max_results": max_results,
+                "page_token": page_token,
+                "include_spans": include_spans,
+            }
+        )
+        return PagedList(self._traces[:max_results], None)
+
+    def log_batch(self, run_id, metrics=(), params=(), tags=()):
+        for tag in tags:
+            self._runs[run_id].data.tags[tag.key] = tag.value
+
+    def snapshot(self):
+        """Return a per-test view of this client with copy-on-write state.
+
+        Writes land in a fresh front map of a ChainMap, so any number of tests (or
+        pytest-xdist workers) can branch from one prebuilt base instance without
+        copying it and without leaking state back into it.
+        """
+        clone = copy.copy(self)
+        clone._runs = ChainMap({}, self._runs)
+        clone._raw_artifacts = ChainMap({}, self._raw_artifacts)
+        clone._traces = list(self._traces)
+        clone._search_traces_calls = []
+        clone._download_dir = tempfile.mkdtemp(prefix="mock_insights_artifacts_")
+        return clone
+
+
+@pytest.fixture(scope="session")
+def session_mock_base():
+    """Prebuilt base client shared for the whole session; tests get snapshots."""
+    base = MockMlflowClient()
+    yield base
+    shutil.rmtree(base._download_dir, ignore_errors=True)
+
+
+@pytest.fixture
+def mock_mlflow_client(session_mock_base):
+    client = session_mock_base.snapshot()
+    yield client
+    shutil.rmtree(client._download_dir, ignore_errors=True)
+
+
+@pytest.fixture
+def client(mock_mlflow_client):
+    """InsightsClient wired to the in-memory mock, shared by every client test."""
+    return InsightsClient(tracking_client=mock_mlflow_client)
+
+
+@pytest.fixture(scope="session")
+def analysis_stub():
+    """Minimal analysis artifact payload shared by every client test.
+
+    Most client tests only need *an* analysis to exist on the run; they share this
+    one dict (read-only) instead of rebuilding it per test.
+    """
+    return MappingProxyType({"name": "Test", "status": "ACTIVE"})
+
+
+@pytest.fixture
+def make_analysis_run_setup(mock_mlflow_client, analysis_stub):
+    """Factory that seeds the mock store with an analysis artifact for a run."""
+
+    def _setup(run_id="analysis-run-id"):
+        mock_mlflow_client._raw_artifacts[f"{run_id}/insights/analysis.yaml"] = analysis_stub
+        return run_id
+
+    return _setup
+
+
+@pytest.fixture(autouse=True)
+def clear_insights_caches():
+    """Reset the module-level memos in ``mlflow.insights.utils`` around each test."""
+    insights_utils.clear_parent_run_cache()
+    insights_utils._ARTIFACT_LIST_CACHE.clear()
+    insights_utils._RUN_TAGS_CACHE.clear()
+    yield
+    insights_utils.clear_parent_run_cache()
+    insights_utils._ARTIFACT_LIST_CACHE.clear()
+    insights_utils._RUN_TAGS_CACHE.clear()
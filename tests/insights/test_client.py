@@ -0,0 +1,328 @@
+import uuid
+from types import MappingProxyType
+from unittest import mock
+
+import pytest
+from pydantic import ValidationError
+
+from mlflow.exceptions import MlflowException
+from mlflow.insights.models import (
+    AnalysisStatus,
+    EvidenceEntry,
+    HypothesisStatus,
+    IssueSeverity,
+    IssueStatus,
+)
+
+from tests.insights.conftest import create_mock_run, setup_parent_analysis
+
+# Static payloads shared across tests, built once at import. MappingProxyType makes
+# the read-only contract explicit: a test that accidentally mutates one fails loudly
+# instead of leaking state into its neighbors.
+_ISSUE1 = MappingProxyType(
+    {
+        "issue_id": "issue-1",
+        "title": "Slow tool calls",
+        "description": "p99 tool latency exceeds the SLA",
+        "severity": "MEDIUM",
+        "evidence": [
+            {"trace_id": "tr-1", "rationale": "8s tool span"},
+            {"trace_id": "tr-2", "rationale": "6s tool span"},
+        ],
+    }
+)
+_ISSUE2 = MappingProxyType(
+    {
+        "issue_id": "issue-2",
+        "title": "Retries mask upstream errors",
+        "description": "5xx responses are retried without logging",
+        "severity": "HIGH",
+        "evidence": [
+            {"trace_id": "tr-3", "rationale": "Silent retry after 502"},
+            {"trace_id": "tr-4", "rationale": "Silent retry after 503"},
+            {"trace_id": "tr-5", "rationale": "Three retries, no log line"},
+            {"trace_id": "tr-6", "rationale": "Retry storm during deploy"},
+            {"trace_id": "tr-7", "rationale": "Retry loop exhausted budget"},
+        ],
+    }
+)
+_ISSUE3 = MappingProxyType(
+    {
+        "issue_id": "issue-3",
+        "title": "Truncated prompts",
+        "description": "Prompts over 8k tokens are truncated silently",
+        "severity": "LOW",
+        "evidence": [
+            {"trace_id": "tr-8", "rationale": "Prompt cut mid-sentence"},
+        ],
+    }
+)
+_ISSUE_PAYLOADS = (_ISSUE1, _ISSUE2, _ISSUE3)
+# Built once at import; the mock store holds the objects directly, so seeding these
+# artifacts is a dict update with no serialization at all.
+_ISSUE_ARTIFACTS = {
+    f"analysis-run-id/insights/issue_{issue['issue_id']}.yaml": issue for issue in _ISSUE_PAYLOADS
+}
+_HYPOTHESIS_SEED = MappingProxyType(
+    {
+        "hypothesis_id": "abc123",
+        "statement": "Tool latency causes request timeouts",
+        "testing_plan": "Compare p99 latency of timed-out traces against the baseline",
+        "status": "TESTING",
+    }
+)
+_ISSUE_SEED = MappingProxyType(
+    {
+        "issue_id": "issue-1",
+        "title": "Slow tool calls",
+        "description": "p99 tool latency exceeds the 2s SLA",
+        "severity": "HIGH",
+    }
+)
+
+
+def _make_preview_traces():
+    traces = []
+    for trace_id in ("tr-1", "tr-2"):
+        trace = mock.Mock()
+        trace.info.trace_id = trace_id
+        traces.append(trace)
+    return traces
+
+
+# Trace doubles for the preview tests, built once; the tests only read them.
+_PREVIEW_TRACES = _make_preview_traces()
+
+
+@pytest.fixture(autouse=True, scope="module")
+def mock_mlflow():
+    """Patch the mlflow module used by the insights run helpers once per module.
+
+    A per-test @mock.patch pays patch setup/teardown on every test; a single
+    module-scoped patch amortizes that to one cycle. Tests that assert call
+    counts reset the mock first.
+    """
+    with mock.patch("mlflow.insights.utils.mlflow") as mocked:
+        yield mocked
+
+
+def test_create_analysis(client, mock_mlflow_client, mock_mlflow):
+    mock_mlflow.reset_mock()
+    _, analysis_run = setup_parent_analysis(mock_mlflow_client)
+    mock_mlflow.start_run.return_value.__enter__.return_value = analysis_run
+
+    run_id = client.create_analysis("0", "Test", description="Initial latency analysis")
+
+    assert run_id == "analysis-run-id"
+    mock_mlflow.start_run.assert_called_once()
+    data = mock_mlflow_client._raw_artifacts["analysis-run-id/insights/analysis.yaml"]
+    assert data["name"] == "Test"
+    assert data["description"] == "Initial latency analysis"
+    assert data["status"] == "ACTIVE"
+
+
+def test_get_analysis_missing_raises(client):
+    with pytest.raises(MlflowException, match="does not contain an insights analysis"):
+        client.get_analysis("unknown-run-id")
+
+
+def test_update_analysis(client, mock_mlflow_client, make_analysis_run_setup):
+    make_analysis_run_setup()
+
+    updated = client.update_analysis(
+        "analysis-run-id", description="Revised scope", status=AnalysisStatus.COMPLETED
+    )
+
+    assert updated.description == "Revised scope"
+    assert updated.status == AnalysisStatus.COMPLETED
+    stored = mock_mlflow_client._raw_artifacts["analysis-run-id/insights/analysis.yaml"]
+    assert stored["description"] == "Revised scope"
+    assert stored["status"] == "COMPLETED"
+
+
+def test_list_analyses(client, mock_mlflow_client):
+    run_a = create_mock_run("run-a", run_type="analysis")
+    run_b = create_mock_run("run-b", run_type="analysis")
+    mock_mlflow_client._runs["run-a"] = run_a
+    mock_mlflow_client._runs["run-b"] = run_b
+    mock_mlflow_client.bulk_set_artifacts(
+        {
+            "run-a/insights/analysis.yaml": {"name": "Analysis A", "status": "ACTIVE"},
+            "run-b/insights/analysis.yaml": {"name": "Analysis B", "status": "COMPLETED"},
+        }
+    )
+
+    summaries = client.list_analyses("0")
+
+    assert [summary.name for summary in summaries] == ["Analysis A", "Analysis B"]
+    assert summaries[0].run_id == "run-a"
+    assert summaries[1].status == AnalysisStatus.COMPLETED
+
+
+def test_create_hypothesis(client, mock_mlflow_client, make_analysis_run_setup):
+    make_analysis_run_setup()
+
+    hypothesis = client.create_hypothesis(
+        "analysis-run-id",
+        "Tool latency causes request timeouts",
+        testing_plan="Compare p99 latency of timed-out traces against the baseline",
+    )
+
+    # IDs are uuid4().hex; parsing validates structure, not just length.
+    uuid.UUID(hypothesis.hypothesis_id)
+    assert hypothesis.status == HypothesisStatus.TESTING
+    key = f"analysis-run-id/insights/hypothesis_{hypothesis.hypothesis_id}.yaml"
+    stored = mock_mlflow_client._raw_artifacts[key]
+    assert stored["statement"] == "Tool latency causes request timeouts"
+    assert stored["status"] == "TESTING"
+    assert stored["evidence"] == []
+
+
+def test_create_hypothesis_without_testing_plan_fails(client, make_analysis_run_setup):
+    make_analysis_run_setup()
+
+    with pytest.raises(ValidationError, match="testing_plan"):
+        client.create_hypothesis(
+            "analysis-run-id", "Latency spikes come from retries", testing_plan=None
+        )
+
+
+def test_get_hypothesis_not_found(client):
+    with pytest.raises(MlflowException, match="Hypothesis 'missing' not found"):
+        client.get_hypothesis("analysis-run-id", "missing")
+
+
+def test_update_hypothesis(client, mock_mlflow_client):
+    key = "analysis-run-id/insights/hypothesis_abc123.yaml"
+    mock_mlflow_client._raw_artifacts[key] = _HYPOTHESIS_SEED
+
+    updated = client.update_hypothesis(
+        "analysis-run-id",
+        "abc123",
+        status=HypothesisStatus.VALIDATED,
+        evidence=[("tr-1", "p99 is 40x the baseline for this trace", True)],
+    )
+
+    assert updated.status == HypothesisStatus.VALIDATED
+    assert updated.trace_count == 1
+    stored = mock_mlflow_client._raw_artifacts["analysis-run-id/insights/hypothesis_abc123.yaml"]
+    assert stored["status"] == "VALIDATED"
+    assert stored["evidence"][0]["trace_id"] == "tr-1"
+    assert stored["evidence"][0]["supports"] is True
+
+
+def test_list_hypotheses_paginated(client, mock_mlflow_client):
+    for index in range(3):
+        mock_mlflow_client._raw_artifacts[f"analysis-run-id/insights/hypothesis_h{index}.yaml"] = {
+            "hypothesis_id": f"h{index}",
+            "statement": f"Hypothesis {index}",
+            "testing_plan": "Inspect traces",
+        }
+
+    first_page = client.list_hypotheses("analysis-run-id", page_size=2)
+    assert [h.hypothesis_id for h in first_page] == ["h0", "h1"]
+    assert first_page.token is not None
+
+    second_page = client.list_hypotheses(
+        "analysis-run-id", page_size=2, page_token=first_page.token
+    )
+    assert [h.hypothesis_id for h in second_page] == ["h2"]
+    assert second_page.token is None
+
+
+def test_evidence_structure_validation(client, mock_mlflow_client, make_analysis_run_setup):
+    make_analysis_run_setup()
+
+    hypothesis = client.create_hypothesis(
+        "analysis-run-id",
+        "Retries mask upstream 5xx errors",
+        testing_plan="Sample error traces and inspect retry spans",
+    )
+    updated = client.update_hypothesis(
+        "analysis-run-id",
+        hypothesis.hypothesis_id,
+        evidence=[
+            ("tr-1", "Retry span present before the 5xx response", True),
+            ("tr-2", "No retries despite an upstream failure", False),
+            ("tr-3", "Trace truncated; inconclusive", None),
+        ],
+    )
+
+    assert all(isinstance(entry, EvidenceEntry) for entry in updated.evidence)
+    assert [entry.supports for entry in updated.evidence] == [True, False, None]
+    key = f"analysis-run-id/insights/hypothesis_{hypothesis.hypothesis_id}.yaml"
+    stored = mock_mlflow_client._raw_artifacts[key]
+    assert {entry["trace_id"] for entry in stored["evidence"]} == {"tr-1", "tr-2", "tr-3"}
+
+
+def test_create_issue_in_parent_run(client, mock_mlflow_client, make_analysis_run_setup):
+    setup_parent_analysis(mock_mlflow_client)
+    make_analysis_run_setup()
+
+    issue = client.create_issue(
+        "analysis-run-id",
+        "Slow tool calls",
+        "p99 tool latency exceeds the 2s SLA during peak hours",
+        severity=IssueSeverity.HIGH,
+    )
+
+    assert issue.severity == IssueSeverity.HIGH
+    assert issue.status == IssueStatus.OPEN
+    key = f"analysis-run-id/insights/issue_{issue.issue_id}.yaml"
+    stored = mock_mlflow_client._raw_artifacts[key]
+    assert stored["title"] == "Slow tool calls"
+    assert stored["severity"] == "HIGH"
+
+
+def test_update_issue(client, mock_mlflow_client):
+    key = "analysis-run-id/insights/issue_issue-1.yaml"
+    mock_mlflow_client._raw_artifacts[key] = _ISSUE_SEED
+
+    updated = client.update_issue(
+        "analysis-run-id",
+        "issue-1",
+        status=IssueStatus.CONFIRMED,
+        evidence=[("tr-9", "Tool span held the trace for 8s")],
+    )
+
+    assert updated.status == IssueStatus.CONFIRMED
+    assert updated.trace_count == 1
+    stored = mock_mlflow_client._raw_artifacts["analysis-run-id/insights/issue_issue-1.yaml"]
+    assert stored["status"] == "CONFIRMED"
+    assert stored["evidence"][0]["trace_id"] == "tr-9"
+
+
+def test_list_issues_sorted_by_trace_count(client, mock_mlflow_client):
+    setup_parent_analysis(mock_mlflow_client)
+
+    mock_mlflow_client.bulk_set_artifacts(_ISSUE_ARTIFACTS)
+
+    issues = client.list_issues("analysis-run-id")
+
+    assert len(issues) == 3
+    by_trace_count = sorted(issues, key=lambda issue: issue.trace_count, reverse=True)
+    assert [issue.issue_id for issue in by_trace_count] == ["issue-2", "issue-1", "issue-3"]
+
+
+def test_preview_hypotheses_returns_traces(client, mock_mlflow_client):
+    mock_mlflow_client._traces = list(_PREVIEW_TRACES)
+
+    traces = client.preview_hypotheses("0", filter_string="status = 'ERROR'")
+
+    assert list(traces) == _PREVIEW_TRACES
+    call = mock_mlflow_client._search_traces_calls[-1]
+    assert call["experiment_ids"] == ["0"]
+    assert call["filter_string"] == "status = 'ERROR'"
+    assert call["include_spans"] is False
+
+
+def test_preview_issues_returns_traces(client, mock_mlflow_client):
+    setup_parent_analysis(mock_mlflow_client)
+    mock_mlflow_client._traces = list(_PREVIEW_TRACES)
+
+    traces = client.preview_issues("0", max_traces=50)
+
+    assert list(traces) == _PREVIEW_TRACES
+    call = mock_mlflow_client._search_traces_calls[-1]
+    assert call["max_results"] == 50
+    assert call["include_spans"] is False
@@ -0,0 +1,172 @@
+from datetime import datetime, timezone
+
+import pytest
+from pydantic import ValidationError
+
+from mlflow.insights.models import (
+    Analysis,
+    AnalysisStatus,
+    AnalysisSummary,
+    EvidenceEntry,
+    Hypothesis,
+    HypothesisStatus,
+    HypothesisSummary,
+    Issue,
+    IssueSeverity,
+    IssueStatus,
+    IssueSummary,
+)
+
+from tests.insights.conftest import dump, load
+
+
+def test_analysis_defaults():
+    analysis = Analysis(name="Test")
+    assert analysis.description is None
+    assert analysis.status == AnalysisStatus.ACTIVE
+    assert analysis.created_at.tzinfo is not None
+    assert analysis.updated_at >= analysis.created_at
+
+
+def test_analysis_update_timestamp(monkeypatch):
+    analysis = Analysis(name="Test")
+    original = analysis.updated_at
+    frozen = datetime(2099, 1, 1, tzinfo=timezone.utc)
+    monkeypatch.setattr("mlflow.insights.models._utcnow", lambda: frozen)
+    analysis.update_timestamp()
+    assert analysis.updated_at == frozen
+    assert analysis.updated_at > original
+
+
+def test_analysis_serialization():
+    analysis = Analysis(name="Test", description="Latency investigation")
+    json_str = analysis.model_dump_json()
+    loaded = Analysis.model_validate_json(json_str)
+    assert loaded.name == "Test"
+    assert loaded.description == "Latency investigation"
+    assert loaded.status == AnalysisStatus.ACTIVE
+    assert loaded.created_at == analysis.created_at
+
+
+def test_evidence_entry_serialization():
+    entry = EvidenceEntry(trace_id="tr-1", rationale="Tool span held the trace", supports=True)
+    loaded = EvidenceEntry.model_validate_json(entry.model_dump_json())
+    assert loaded.trace_id == "tr-1"
+    assert loaded.supports is True
+
+
+def test_hypothesis_requires_testing_plan():
+    with pytest.raises(ValidationError, match="testing_plan"):
+        Hypothesis(statement="Latency correlates with tool depth")
+
+
+def test_hypothesis_trace_count_is_distinct():
+    hypothesis = Hypothesis(
+        statement="Retries mask upstream errors", testing_plan="Sample error traces"
+    )
+    hypothesis.add_evidence("tr-1", "Silent retry after 502", supports=True)
+    hypothesis.add_evidence("tr-1", "Same trace, second retry span", supports=True)
+    hypothesis.add_evidence("tr-2", "No retry despite failure", supports=False)
+    assert len(hypothesis.evidence) == 3
+    assert hypothesis.trace_count == 2
+
+
+def test_issue_defaults():
+    issue = Issue(title="Slow tool calls", description="p99 over SLA", severity=IssueSeverity.HIGH)
+    assert issue.status == IssueStatus.OPEN
+    assert issue.source_hypothesis_id is None
+    assert issue.evidence == []
+    assert issue.assessments == []
+
+
+def test_issue_add_assessment_deduplicates():
+    issue = Issue(title="Slow tool calls", description="p99 over SLA", severity=IssueSeverity.LOW)
+    issue.add_assessment("latency_check")
+    issue.add_assessment("latency_check")
+    issue.add_assessment("error_rate_check")
+    assert issue.assessments == ["latency_check", "error_rate_check"]
+
+
+def test_hypothesis_summary_from_hypothesis():
+    hypothesis = Hypothesis(
+        statement="Tool latency causes timeouts",
+        testing_plan="Compare p99 latencies",
+        status=HypothesisStatus.VALIDATED,
+    )
+    hypothesis.add_evidence("tr-1", "40x baseline latency", supports=True)
+    summary = HypothesisSummary.from_hypothesis(hypothesis)
+    assert summary.hypothesis_id == hypothesis.hypothesis_id
+    assert summary.status == HypothesisStatus.VALIDATED
+    assert summary.trace_count == 1
+    assert summary.created_at_ms == int(hypothesis.created_at.timestamp() * 1000)
+
+
+def test_analysis_summary_from_analysis():
+    analysis = Analysis(name="Test")
+    hypotheses = [
+        HypothesisSummary(
+            hypothesis_id="h1",
+            statement="Validated one",
+            status=HypothesisStatus.VALIDATED,
+            created_at_ms=0,
+            updated_at_ms=0,
+        ),
+        HypothesisSummary(
+            hypothesis_id="h2",
+            statement="Still testing",
+            status=HypothesisStatus.TESTING,
+            created_at_ms=0,
+            updated_at_ms=0,
+        ),
+    ]
+    summary = AnalysisSummary.from_analysis(analysis, "analysis-run-id", hypotheses)
+    assert summary.run_id == "analysis-run-id"
+    assert summary.hypothesis_count == 2
+    assert summary.validated_count == 1
+
+
+def test_issue_summary_from_issue():
+    issue = Issue(
+        title="Slow tool calls",
+        description="p99 over SLA",
+        severity=IssueSeverity.CRITICAL,
+        status=IssueStatus.CONFIRMED,
+    )
+    issue.add_evidence("tr-1", "8s tool span")
+    issue.add_evidence("tr-2", "6s tool span")
+    summary = IssueSummary.from_issue(issue)
+    assert summary.issue_id == issue.issue_id
+    assert summary.severity == IssueSeverity.CRITICAL
+    assert summary.trace_count == 2
+
+
+@pytest.mark.parametrize(
+    ("model_cls", "payload"),
+    [
+        (
+            Hypothesis,
+            {
+                "statement": "Tool latency causes timeouts",
+                "testing_plan": "Compare p99 latencies",
+                "rationale": "Timeouts cluster around tool-heavy traces",
+                "evidence": [
+                    {"trace_id": "tr-1", "rationale": "40x baseline latency", "supports": True}
+                ],
+            },
+        ),
+        (
+            Issue,
+            {
+                "title": "Slow tool calls",
+                "description": "p99 over SLA",
+                "severity": "HIGH",
+                "evidence": [{"trace_id": "tr-1", "rationale": "8s tool span"}],
+            },
+        ),
+    ],
+)
+def test_yaml_roundtrip(model_cls, payload):
+    obj = model_cls(**payload)
+    data = obj.model_dump(mode="json")
+    loaded = model_cls.model_validate(load(dump(data)))
+    assert loaded.model_dump() == obj.model_dump()